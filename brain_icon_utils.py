@@ -0,0 +1,28 @@
+"""Shared helpers for the brain icon scripts."""
+
+from PIL import Image
+
+# Sizes written into every .ico, largest first. Windows only loads 16/32 (tray,
+# small icons), 48 (taskbar) and 256 (Explorer large icons) in practice.
+ICON_SIZES = [(256, 256), (48, 48), (32, 32), (16, 16)]
+
+
+def downsample(image, sizes=ICON_SIZES):
+    """Resize image to each size, largest first, feeding each step the previous result."""
+    images = []
+    prev = image
+    for size in sorted(sizes, reverse=True):
+        if prev.size != size:
+            prev = prev.resize(size, Image.Resampling.LANCZOS)
+        images.append(prev)
+    return images
+
+
+def save_ico(image, icon_path, sizes=ICON_SIZES):
+    """Save image as a multi-size .ico using the progressively downsampled frames."""
+    images = downsample(image, sizes)
+    # Store frames as BMP rather than PNG to skip the zlib encode
+    images[0].save(icon_path, format='ICO',
+                   sizes=[im.size for im in images],
+                   append_images=images[1:],
+                   bitmap_format='bmp')
@@ -6,16 +6,24 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.meeting_manager import MeetingManager, MeetingState
+from src.meeting_manager import MeetingManager, MeetingState, get_default_manager
 from src.config import Config
 
+# Created on first use so the menu appears without loading audio/memory state
+manager = None
+
+def _get_manager() -> MeetingManager:
+    """Return the meeting manager, creating it on first use."""
+    global manager
+    if manager is None:
+        manager = get_default_manager()
+    return manager
+
 def main():
     print("=" * 70)
     print("MEETING LISTENER - Command Line Controller")
     print("=" * 70)
 
-    manager = MeetingManager()
-
     while True:
         print("\nOptions:")
         print("  1. Start Recording")
@@ -30,7 +38,7 @@ def main():
             print("Play audio or speak into your microphone.")
             print("The system will capture audio and transcribe every 30 seconds.\n")
 
-            success = manager.start_meeting()
+            success = _get_manager().start_meeting()
             if success:
                 print("[OK] Recording started!")
                 print("- Audio is being captured from your speakers")
@@ -42,7 +50,7 @@ def main():
 
         elif choice == "2":
             print("\n[Stopping recording...]")
-            summary_path = manager.stop_meeting()
+            summary_path = manager.stop_meeting() if manager else None
 
             if summary_path:
                 print(f"[OK] Recording stopped!")
@@ -56,10 +64,10 @@ def main():
                 print("[ERROR] No recording in progress")
 
         elif choice == "3":
-            info = manager.get_meeting_info()
-            print(f"\nStatus: {info['state']}")
+            info = manager.get_meeting_info() if manager else None
+            print(f"\nStatus: {info['state'] if info else MeetingState.IDLE.value}")
 
-            if info['state'] != 'idle':
+            if info and info['state'] != 'idle':
                 print(f"Meeting ID: {info['meeting_id']}")
                 print(f"Duration: {info['duration']}")
                 print(f"Chunks processed: {info['chunks_processed']}")
@@ -69,10 +77,11 @@ def main():
 
         elif choice == "4":
             print("\nExiting...")
-            if manager.get_state() != MeetingState.IDLE:
-                print("Stopping current recording first...")
-                manager.stop_meeting()
-            manager.cleanup()
+            if manager:
+                if manager.get_state() != MeetingState.IDLE:
+                    print("Stopping current recording first...")
+                    manager.stop_meeting()
+                manager.cleanup()
             break
         else:
             print("[ERROR] Invalid choice")
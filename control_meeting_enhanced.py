@@ -1,4 +1,5 @@
 """Enhanced CLI to control Meeting Listener with query and document features."""
+import re
 import sys
 import time
 from pathlib import Path
@@ -7,45 +8,105 @@ from tkinter import Tk, filedialog
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.meeting_manager import MeetingManager, MeetingState
-from src.query_interface import QueryInterface
+from src.meeting_manager import MeetingManager, MeetingState, get_default_manager
+from src.query_interface import QueryInterface, get_default_query_interface
 from src.config import Config
 
+# Drag & drop path parsing: quoted paths, or bare paths split before a drive letter
+QUOTED_PATH_RE = re.compile(r'"([^"]+)"')
+DRIVE_SPLIT_RE = re.compile(r'\s+(?=[A-Z]:\\)')
+
+# Static menu/header text, built once and written with a single call
+MENU = "\n".join([
+    "",
+    "=" * 70,
+    "OPTIONS",
+    "=" * 70,
+    "  1. Start Recording",
+    "  2. Stop Recording",
+    "  3. View Status",
+    "",
+    "  4. Ask Question (Query REMS knowledge)",
+    "  5. Upload REMS Document",
+    "  6. View Documents",
+    "  7. View Meeting History",
+    "",
+    "  8. Learn NEXPLANON from Web (Build knowledge base)",
+    "  9. View Web Knowledge Status",
+    "",
+    "  0. Exit",
+    "",
+])
+
+# Word shortcuts accepted alongside the menu numbers
+MENU_ALIASES = {
+    'record': '1', 'stop': '2', 'status': '3',
+    'ask': '4', 'upload': '5', 'docs': '6', 'history': '7',
+    'learn': '8', 'web': '9', 'exit': '0',
+}
+
+ASK_HEADER = "\n".join([
+    "",
+    "-" * 70,
+    "ASK A QUESTION",
+    "-" * 70,
+    "Ask anything about REMS, past meetings, action items, decisions, etc.",
+    "Examples:",
+    "  - What training requirements were discussed?",
+    "  - What are the pending action items for Sarah?",
+    "  - What decisions were made about virtual training?",
+    "",
+    "",
+])
+
+UPLOAD_HEADER = "\n".join([
+    "",
+    "-" * 70,
+    "UPLOAD REMS DOCUMENTS",
+    "-" * 70,
+    "Drag & drop files here (select multiple in Explorer)",
+    "Tip: Ctrl+Click or Ctrl+A to select multiple, then drag all at once",
+    "",
+    "",
+])
+
+# Created on first use so the menu appears without loading audio/memory state
+manager = None
+query_interface = None
+
+def _get_manager() -> MeetingManager:
+    """Return the meeting manager, creating it on first use."""
+    global manager
+    if manager is None:
+        manager = get_default_manager()
+    return manager
+
+def _get_query_interface() -> QueryInterface:
+    """Return the query interface, creating it on first use."""
+    global query_interface
+    if query_interface is None:
+        query_interface = get_default_query_interface(memory=_get_manager().memory)
+    return query_interface
+
 def main():
     print("=" * 70)
     print("REMS ASSISTANT")
     print("AI-Powered Meeting Intelligence")
     print("=" * 70)
 
-    manager = MeetingManager()
-    query_interface = QueryInterface(memory=manager.memory)
-
-    # Show startup info
-    num_meetings = len(manager.memory.memory_data['meetings'])
-    num_docs = len(manager.memory.memory_data['documents'])
-    print(f"\nLoaded: {num_meetings} previous meetings, {num_docs} documents")
+    # Menu is shown once; re-shown only on request ("?" or empty input)
+    sys.stdout.write(MENU)
+    sys.stdout.flush()
 
     while True:
-        print("\n" + "=" * 70)
-        print("OPTIONS")
-        print("=" * 70)
-        print("  1. Start Recording")
-        print("  2. Stop Recording")
-        print("  3. View Status")
-        print()
-        print("  4. Ask Question (Query REMS knowledge)")
-        print("  5. Upload REMS Document")
-        print("  6. View Documents")
-        print("  7. View Meeting History")
-        print()
-        print("  8. Learn NEXPLANON from Web (Build knowledge base)")
-        print("  9. View Web Knowledge Status")
-        print()
-        print("  0. Exit")
-
-        choice = input("\nEnter choice: ").strip()
-
-        if choice == "1":
+        choice = input("\nEnter choice (? for menu): ").strip().lower()
+        choice = MENU_ALIASES.get(choice, choice)
+
+        if choice in ("", "?"):
+            sys.stdout.write(MENU)
+            sys.stdout.flush()
+
+        elif choice == "1":
             print("\n" + "-" * 70)
             print("[Starting recording...]")
             print("-" * 70)
@@ -57,7 +118,7 @@ def main():
             print("  - Remember everything for future reference")
             print()
 
-            success = manager.start_meeting()
+            success = _get_manager().start_meeting()
             if success:
                 print("[OK] Recording started!")
             else:
@@ -67,7 +128,7 @@ def main():
             print("\n" + "-" * 70)
             print("[Stopping recording...]")
             print("-" * 70)
-            summary_path = manager.stop_meeting()
+            summary_path = manager.stop_meeting() if manager else None
 
             if summary_path:
                 print(f"[OK] Recording stopped!")
@@ -85,10 +146,10 @@ def main():
             print("\n" + "-" * 70)
             print("CURRENT STATUS")
             print("-" * 70)
-            info = manager.get_meeting_info()
-            print(f"State: {info['state']}")
+            info = manager.get_meeting_info() if manager else None
+            print(f"State: {info['state'] if info else MeetingState.IDLE.value}")
 
-            if info['state'] != 'idle':
+            if info and info['state'] != 'idle':
                 print(f"Meeting ID: {info['meeting_id']}")
                 print(f"Duration: {info['duration']}")
                 print(f"Chunks processed: {info['chunks_processed']}")
@@ -97,20 +158,12 @@ def main():
                 print("No meeting in progress")
 
         elif choice == "4":
-            print("\n" + "-" * 70)
-            print("ASK A QUESTION")
-            print("-" * 70)
-            print("Ask anything about REMS, past meetings, action items, decisions, etc.")
-            print("Examples:")
-            print("  - What training requirements were discussed?")
-            print("  - What are the pending action items for Sarah?")
-            print("  - What decisions were made about virtual training?")
-            print()
+            sys.stdout.write(ASK_HEADER)
             question = input("Your question: ").strip()
 
             if question:
                 print("\n[Querying Claude with full meeting history...]")
-                answer = query_interface.query(question)
+                answer = _get_query_interface().query(question)
                 print("\n" + "-" * 70)
                 print("ANSWER")
                 print("-" * 70)
@@ -120,28 +173,22 @@ def main():
                 print("[ERROR] No question entered")
 
         elif choice == "5":
-            print("\n" + "-" * 70)
-            print("UPLOAD REMS DOCUMENTS")
-            print("-" * 70)
-            print("Drag & drop files here (select multiple in Explorer)")
-            print("Tip: Ctrl+Click or Ctrl+A to select multiple, then drag all at once")
-            print()
+            sys.stdout.write(UPLOAD_HEADER)
             doc_paths_str = input("Drop files here: ").strip()
 
             if doc_paths_str:
                     # Parse multiple file paths - Windows style
-                    import re
                     file_paths = []
 
                     if '"' in doc_paths_str:
                         # Paths with quotes: "C:\path\file1.pdf" "C:\path\file2.pdf"
-                        matches = re.findall(r'"([^"]+)"', doc_paths_str)
+                        matches = QUOTED_PATH_RE.findall(doc_paths_str)
                         file_paths = matches if matches else [doc_paths_str.strip('"').strip("'")]
                     else:
                         # Paths without quotes: C:\path\file1.pdf C:\path\file2.pdf
                         # Split on whitespace that comes before a drive letter pattern
-                        paths = re.split(r'\s+(?=[A-Z]:\\)', doc_paths_str)
-                        file_paths = [p.strip() for p in paths if p.strip()]
+                        paths = DRIVE_SPLIT_RE.split(doc_paths_str)
+                        file_paths = [p for p in map(str.strip, paths) if p]
 
                     total_files = len(file_paths)
                     print(f"\nFound {total_files} file(s) to upload")
@@ -152,14 +199,16 @@ def main():
                     updated_count = 0
                     failed_files = []
 
-                    for idx, file_path_str in enumerate(file_paths, 1):
-                        doc_path = Path(file_path_str)
+                    # Add all files in one batch (single memory save)
+                    doc_paths = [Path(p) for p in file_paths]
+                    statuses = _get_query_interface().add_rems_documents(doc_paths)
+
+                    for idx, (doc_path, status) in enumerate(zip(doc_paths, statuses), 1):
                         percentage = int((idx / total_files) * 100)
 
                         print(f"\n[{idx}/{total_files}] ({percentage}%) Processing: {doc_path.name}")
 
                         if doc_path.exists():
-                            status = query_interface.add_rems_document(doc_path)
                             if status == 'added':
                                 print(f"    ✓ Added successfully")
                                 added_count += 1
@@ -196,7 +245,7 @@ def main():
             print("\n" + "-" * 70)
             print("UPLOADED DOCUMENTS")
             print("-" * 70)
-            docs = query_interface.list_documents()
+            docs = _get_query_interface().list_documents()
             if docs:
                 for i, doc in enumerate(docs, 1):
                     print(f"  {i}. {doc}")
@@ -207,7 +256,11 @@ def main():
             print("\n" + "-" * 70)
             print("MEETING HISTORY")
             print("-" * 70)
-            summary = query_interface.get_meeting_summary()
+            memory_data = _get_manager().memory.memory_data
+            num_meetings = len(memory_data['meetings'])
+            num_docs = len(memory_data['documents'])
+            print(f"Loaded: {num_meetings} previous meetings, {num_docs} documents\n")
+            summary = _get_query_interface().get_meeting_summary()
             print(summary)
 
         elif choice == "8":
@@ -228,7 +281,7 @@ def main():
             confirm = input("Continue? (y/n): ").strip().lower()
             if confirm == 'y':
                 print("\n[Learning from public sources...]")
-                results = query_interface.learn_nexplanon_from_web()
+                results = _get_query_interface().learn_product_from_web()
 
                 if results['success']:
                     print("\n[OK] Learning complete!")
@@ -245,15 +298,16 @@ def main():
             print("\n" + "-" * 70)
             print("WEB KNOWLEDGE STATUS")
             print("-" * 70)
-            status = query_interface.get_web_knowledge_status()
+            status = _get_query_interface().get_web_knowledge_status()
             print(status)
 
         elif choice == "0":
             print("\nExiting...")
-            if manager.get_state() != MeetingState.IDLE:
-                print("Stopping current recording first...")
-                manager.stop_meeting()
-            manager.cleanup()
+            if manager:
+                if manager.get_state() != MeetingState.IDLE:
+                    print("Stopping current recording first...")
+                    manager.stop_meeting()
+                manager.cleanup()
             break
 
         else:
@@ -1,9 +1,14 @@
 """Create brain icon similar to typical brain logos - top-down view with organic curves."""
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
-def create_brain_icon():
-    """Create a brain logo showing top-down view with two hemispheres."""
+from brain_icon_utils import save_ico
+
+@lru_cache(maxsize=1)
+def render_brain_icon():
+    """Render a brain logo showing top-down view with two hemispheres (256x256, cached)."""
     size = 256
     image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
     dc = ImageDraw.Draw(image)
@@ -37,8 +42,7 @@ def create_brain_icon():
         (33*scale, 40*scale),
         (32*scale, 46*scale),
     ]
-    for i in range(len(fissure_points) - 1):
-        dc.line([fissure_points[i], fissure_points[i+1]], fill='black', width=3)
+    dc.line(fissure_points, fill='black', width=3, joint='curve')
 
     # LEFT HEMISPHERE organic curves (gyri/folds)
     # Upper left curves
@@ -64,16 +68,14 @@ def create_brain_icon():
     # Lower right curve
     dc.arc([33*scale, 40*scale, 42*scale, 46*scale], start=260, end=20, fill='black', width=3)
 
+    return image
+
+def create_brain_icon():
+    """Render the brain icon and save it as a multi-size .ico file."""
     # Save
     icon_path = r"C:\Users\khyeh\assistant\pilot_brain_v3.ico"
 
-    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    images = []
-    for s in sizes:
-        resized = image.resize(s, Image.Resampling.LANCZOS)
-        images.append(resized)
-
-    images[0].save(icon_path, format='ICO', sizes=[(s[0], s[1]) for s in sizes])
+    save_ico(render_brain_icon(), icon_path)
     print(f"Cortex-style brain icon created: {icon_path}")
 
 if __name__ == '__main__':
@@ -25,43 +25,38 @@ cd /d "{assistant_dir}"
 start "" "{python_exe}" -m src.main
 '''
 
-    with open(bat_path, 'w') as f:
+    # Batch files want CRLF line endings regardless of the platform running this
+    with open(bat_path, 'w', newline='\r\n') as f:
         f.write(bat_content)
 
     print(f"Created launcher: {bat_path}")
 
-    # Create VBS script to create the shortcut
-    vbs_path = assistant_dir / "create_shortcut.vbs"
-    shortcut_path = desktop / "REMShadow.lnk"
-
-    vbs_content = f'''Set oWS = WScript.CreateObject("WScript.Shell")
-Set oLink = oWS.CreateShortcut("{shortcut_path}")
-oLink.TargetPath = "{bat_path}"
-oLink.WorkingDirectory = "{assistant_dir}"
-oLink.Description = "REMShadow - Meeting Transcription & Analysis"
-oLink.IconLocation = "{icon_path}"
-oLink.Save
-'''
-
-    with open(vbs_path, 'w') as f:
-        f.write(vbs_content)
+    # Create the shortcut directly through the WScript.Shell COM object
+    try:
+        from win32com.client import Dispatch
+    except ImportError:
+        print("\npywin32 is not installed. Run: pip install pywin32")
+        return
 
-    # Run the VBS script to create shortcut
-    import subprocess
-    result = subprocess.run(['cscript.exe', '//NoLogo', str(vbs_path)],
-                          capture_output=True, text=True)
+    shortcut_path = desktop / "REMShadow.lnk"
 
-    if result.returncode == 0:
-        print(f"\nDesktop shortcut created: {shortcut_path}")
-        print("\nYou can now:")
-        print("  1. Double-click 'REMShadow' on your desktop to launch")
-        print("  2. Right-click the tray icon → 'Upload Meeting Recording' to process audio files")
-        print("  3. Right-click the tray icon → 'Start Recording' for live meetings")
-    else:
-        print(f"\nError creating shortcut: {result.stderr}")
+    try:
+        shell = Dispatch("WScript.Shell")
+        link = shell.CreateShortcut(str(shortcut_path))
+        link.TargetPath = str(bat_path)
+        link.WorkingDirectory = str(assistant_dir)
+        link.Description = "REMShadow - Meeting Transcription & Analysis"
+        link.IconLocation = str(icon_path)
+        link.Save()
+    except Exception as e:
+        print(f"\nError creating shortcut: {e}")
+        return
 
-    # Cleanup VBS script
-    vbs_path.unlink()
+    print(f"\nDesktop shortcut created: {shortcut_path}")
+    print("\nYou can now:")
+    print("  1. Double-click 'REMShadow' on your desktop to launch")
+    print("  2. Right-click the tray icon → 'Upload Meeting Recording' to process audio files")
+    print("  3. Right-click the tray icon → 'Start Recording' for live meetings")
 
 if __name__ == '__main__':
     try:
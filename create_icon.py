@@ -1,16 +1,47 @@
 """Create brain icon file for Pilot."""
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
-def create_brain_icon():
-    """Create a brain icon and save as .ico file."""
+from brain_icon_utils import save_ico
+
+SCALE = 4  # Geometry below is on a 64x64 grid, drawn at 256x256
+
+# Fold/groove curves as (box, start, end, width), precomputed at full scale
+FOLD_ARCS = [
+    (tuple(c * SCALE for c in box), start, end, width)
+    for box, start, end, width in [
+        # Left hemisphere folds/gyri: top, middle, bottom
+        ((18, 14, 30, 24), 180, 360, 3),
+        ((20, 18, 28, 26), 180, 360, 2),
+        ((18, 26, 30, 36), 180, 360, 3),
+        ((20, 30, 28, 38), 180, 360, 2),
+        ((18, 38, 30, 48), 180, 360, 3),
+        # Right hemisphere folds/gyri (mirror of left)
+        ((34, 14, 46, 24), 180, 360, 3),
+        ((36, 18, 44, 26), 180, 360, 2),
+        ((34, 26, 46, 36), 180, 360, 3),
+        ((36, 30, 44, 38), 180, 360, 2),
+        ((34, 38, 46, 48), 180, 360, 3),
+        # Additional sulci (diagonal grooves), left then right
+        ((19, 20, 29, 32), 200, 340, 2),
+        ((20, 32, 30, 44), 200, 340, 2),
+        ((35, 20, 45, 32), 200, 340, 2),
+        ((34, 32, 44, 44), 200, 340, 2),
+    ]
+]
+
+@lru_cache(maxsize=1)
+def render_brain_icon():
+    """Render the brain icon (256x256, cached)."""
     # Create 256x256 image for high quality
     size = 256
     image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
     dc = ImageDraw.Draw(image)
 
     # Scale up coordinates
-    scale = 4
+    scale = SCALE
 
     # No color - just white fill with black outlines/lines
     fill_color = 'white'
@@ -22,51 +53,18 @@ def create_brain_icon():
     # Central fissure (dividing hemispheres)
     dc.line([32*scale, 14*scale, 32*scale, 50*scale], fill='black', width=4)
 
-    # Left hemisphere folds/gyri (multiple curved lines)
-    # Top left folds
-    dc.arc([18*scale, 14*scale, 30*scale, 24*scale], start=180, end=360, fill='black', width=3)
-    dc.arc([20*scale, 18*scale, 28*scale, 26*scale], start=180, end=360, fill='black', width=2)
-
-    # Middle left folds
-    dc.arc([18*scale, 26*scale, 30*scale, 36*scale], start=180, end=360, fill='black', width=3)
-    dc.arc([20*scale, 30*scale, 28*scale, 38*scale], start=180, end=360, fill='black', width=2)
-
-    # Bottom left folds
-    dc.arc([18*scale, 38*scale, 30*scale, 48*scale], start=180, end=360, fill='black', width=3)
-
-    # Right hemisphere folds/gyri (mirror of left)
-    # Top right folds
-    dc.arc([34*scale, 14*scale, 46*scale, 24*scale], start=180, end=360, fill='black', width=3)
-    dc.arc([36*scale, 18*scale, 44*scale, 26*scale], start=180, end=360, fill='black', width=2)
+    # Hemisphere folds and grooves
+    for box, start, end, width in FOLD_ARCS:
+        dc.arc(box, start=start, end=end, fill='black', width=width)
 
-    # Middle right folds
-    dc.arc([34*scale, 26*scale, 46*scale, 36*scale], start=180, end=360, fill='black', width=3)
-    dc.arc([36*scale, 30*scale, 44*scale, 38*scale], start=180, end=360, fill='black', width=2)
-
-    # Bottom right folds
-    dc.arc([34*scale, 38*scale, 46*scale, 48*scale], start=180, end=360, fill='black', width=3)
-
-    # Additional sulci (grooves) for more detail
-    # Diagonal grooves on left
-    dc.arc([19*scale, 20*scale, 29*scale, 32*scale], start=200, end=340, fill='black', width=2)
-    dc.arc([20*scale, 32*scale, 30*scale, 44*scale], start=200, end=340, fill='black', width=2)
-
-    # Diagonal grooves on right
-    dc.arc([35*scale, 20*scale, 45*scale, 32*scale], start=200, end=340, fill='black', width=2)
-    dc.arc([34*scale, 32*scale, 44*scale, 44*scale], start=200, end=340, fill='black', width=2)
+    return image
 
+def create_brain_icon():
+    """Render the brain icon and save it as a multi-size .ico file."""
     # Save as .ico with multiple sizes
     icon_path = r"C:\Users\khyeh\assistant\pilot_brain.ico"
 
-    # Create multiple sizes for the icon
-    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    images = []
-    for size in sizes:
-        resized = image.resize(size, Image.Resampling.LANCZOS)
-        images.append(resized)
-
-    # Save as .ico
-    images[0].save(icon_path, format='ICO', sizes=[(s[0], s[1]) for s in sizes])
+    save_ico(render_brain_icon(), icon_path)
     print(f"Icon created: {icon_path}")
 
 if __name__ == '__main__':
@@ -1,14 +1,31 @@
 """Create clean simplified brain icon - black and white only."""
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
-def create_brain_icon():
-    """Create a clean, simplified black/white brain icon."""
+from brain_icon_utils import save_ico
+
+SCALE = 4  # Geometry below is on a 64x64 grid, drawn at 256x256
+
+# Fold curves as (box, start, end, width), precomputed at full scale.
+# Left hemisphere top/middle/bottom, then the mirrored right hemisphere.
+FOLD_ARCS = [
+    (tuple(c * SCALE for c in box), 200, 340, 5)
+    for box in [
+        (18, 16, 30, 26), (18, 28, 30, 38), (18, 40, 30, 50),
+        (34, 16, 46, 26), (34, 28, 46, 38), (34, 40, 46, 50),
+    ]
+]
+
+@lru_cache(maxsize=1)
+def render_brain_icon():
+    """Render a clean, simplified black/white brain icon (256x256, cached)."""
     size = 256
     image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
     dc = ImageDraw.Draw(image)
 
-    scale = 4
+    scale = SCALE
 
     # Main brain outline - white fill, thick black border
     dc.ellipse([16*scale, 12*scale, 48*scale, 52*scale],
@@ -17,36 +34,18 @@ def create_brain_icon():
     # Central fissure (vertical line dividing hemispheres)
     dc.line([32*scale, 14*scale, 32*scale, 50*scale], fill='black', width=6)
 
-    # LEFT HEMISPHERE - simplified clean curves (fewer, thicker lines)
-    # Top curve
-    dc.arc([18*scale, 16*scale, 30*scale, 26*scale], start=200, end=340, fill='black', width=5)
-
-    # Middle curve
-    dc.arc([18*scale, 28*scale, 30*scale, 38*scale], start=200, end=340, fill='black', width=5)
+    # Simplified clean curves (fewer, thicker lines) in both hemispheres
+    for box, start, end, width in FOLD_ARCS:
+        dc.arc(box, start=start, end=end, fill='black', width=width)
 
-    # Bottom curve
-    dc.arc([18*scale, 40*scale, 30*scale, 50*scale], start=200, end=340, fill='black', width=5)
-
-    # RIGHT HEMISPHERE - mirror curves
-    # Top curve
-    dc.arc([34*scale, 16*scale, 46*scale, 26*scale], start=200, end=340, fill='black', width=5)
-
-    # Middle curve
-    dc.arc([34*scale, 28*scale, 46*scale, 38*scale], start=200, end=340, fill='black', width=5)
-
-    # Bottom curve
-    dc.arc([34*scale, 40*scale, 46*scale, 50*scale], start=200, end=340, fill='black', width=5)
+    return image
 
+def create_brain_icon():
+    """Render the brain icon and save it as a multi-size .ico file."""
     # Save as NEW filename to bypass cache
     icon_path = r"C:\Users\khyeh\assistant\pilot_icon_new.ico"
 
-    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    images = []
-    for s in sizes:
-        resized = image.resize(s, Image.Resampling.LANCZOS)
-        images.append(resized)
-
-    images[0].save(icon_path, format='ICO', sizes=[(s[0], s[1]) for s in sizes])
+    save_ico(render_brain_icon(), icon_path)
     print(f"NEW icon created: {icon_path}")
 
 if __name__ == '__main__':
@@ -1,9 +1,14 @@
 """Create ultra-simple brain icon - just outline and minimal detail."""
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
-def create_brain_icon():
-    """Create a very simple brain outline."""
+from brain_icon_utils import save_ico
+
+@lru_cache(maxsize=1)
+def render_brain_icon():
+    """Render a very simple brain outline (256x256, cached)."""
     size = 256
     image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
     dc = ImageDraw.Draw(image)
@@ -26,16 +31,14 @@ def create_brain_icon():
     dc.arc([34*scale, 22*scale, 44*scale, 32*scale], start=200, end=340, fill='black', width=4)
     dc.arc([34*scale, 34*scale, 44*scale, 44*scale], start=200, end=340, fill='black', width=4)
 
+    return image
+
+def create_brain_icon():
+    """Render the brain icon and save it as a multi-size .ico file."""
     # Save
     icon_path = r"C:\Users\khyeh\assistant\pilot_icon_new.ico"
 
-    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    images = []
-    for s in sizes:
-        resized = image.resize(s, Image.Resampling.LANCZOS)
-        images.append(resized)
-
-    images[0].save(icon_path, format='ICO', sizes=[(s[0], s[1]) for s in sizes])
+    save_ico(render_brain_icon(), icon_path)
     print(f"Simple brain icon created: {icon_path}")
 
 if __name__ == '__main__':
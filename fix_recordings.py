@@ -1,55 +1,94 @@
 """Fix existing recordings with wrong channel count (stereo->mono)."""
 
+import os
 import wave
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# WAV sample width (bytes) -> NumPy sample dtype. 8-bit WAV is unsigned.
+SAMPLE_DTYPES = {1: np.uint8, 2: np.int16, 4: np.int32}
+
+# Frames read/downmixed per step (~4 MB of 16-bit stereo) to bound memory use
+CHUNK_FRAMES = 1_048_576
+
+
+def downmix_to_mono(frames: bytes, sample_width: int, channels: int) -> bytes:
+    """Average interleaved multi-channel PCM frames down to a single channel."""
+    dtype = SAMPLE_DTYPES[sample_width]
+    samples = np.frombuffer(frames, dtype=dtype).reshape(-1, channels)
+
+    if sample_width == 1:
+        # Centre unsigned 8-bit samples on zero before averaging
+        mixed = (samples.astype(np.int32) - 128).sum(axis=1) // channels + 128
+    else:
+        mixed = samples.astype(np.int64).sum(axis=1) // channels
+
+    return mixed.astype(dtype).tobytes()
+
 
 def fix_recording(wav_path: Path):
     """Fix a WAV file with wrong channel count."""
     try:
-        # Read original file
+        # Read only the header to decide whether the file needs fixing
         with wave.open(str(wav_path), 'rb') as original:
             params = original.getparams()
-            frames = original.readframes(params.nframes)
 
             channels = params.nchannels
             sample_rate = params.framerate
             sample_width = params.sampwidth
 
-            logger.info(f"Original: {wav_path.name} - {channels} channels, {sample_rate}Hz")
+            logger.info(f"{wav_path.name}: original has {channels} channels, {sample_rate}Hz")
 
             # Only fix if it's stereo but should be mono
             if channels != 2:
-                logger.info(f"  Skipping (already {channels} channel(s))")
+                logger.info(f"{wav_path.name}: skipping (already {channels} channel(s))")
                 return False
 
-        # Create backup
+            if sample_width not in SAMPLE_DTYPES:
+                logger.warning(f"{wav_path.name}: skipping (unsupported {sample_width * 8}-bit samples)")
+                return False
+
+        # Read from the untouched backup if an earlier run already made one
         backup_path = wav_path.with_suffix('.wav.backup')
-        if not backup_path.exists():
-            wav_path.rename(backup_path)
-            logger.info(f"  Created backup: {backup_path.name}")
-        else:
-            # Backup already exists, read from it
-            with wave.open(str(backup_path), 'rb') as original:
-                params = original.getparams()
-                frames = original.readframes(params.nframes)
-
-        # Write corrected file (mono, same sample rate)
-        with wave.open(str(wav_path), 'wb') as fixed:
-            fixed.setnchannels(1)  # Mono
-            fixed.setsampwidth(sample_width)
-            fixed.setframerate(sample_rate)
-            fixed.writeframes(frames)
-
-        logger.info(f"  ✓ Fixed: Now 1 channel (mono), {sample_rate}Hz")
+        source_path = backup_path if backup_path.exists() else wav_path
+        tmp_path = wav_path.with_suffix('.wav.tmp')
+
+        # Stream the original frames into a temp file (mono, same sample rate),
+        # one chunk at a time, so a killed run never leaves a partial recording
+        try:
+            with wave.open(str(source_path), 'rb') as original, \
+                    wave.open(str(tmp_path), 'wb') as fixed:
+                channels = original.getnchannels()
+                fixed.setnchannels(1)  # Mono
+                fixed.setsampwidth(sample_width)
+                fixed.setframerate(sample_rate)
+
+                while True:
+                    frames = original.readframes(CHUNK_FRAMES)
+                    if not frames:
+                        break
+                    fixed.writeframes(downmix_to_mono(frames, sample_width, channels))
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Keep the original as a backup, then atomically swap in the fixed file
+        if source_path == wav_path:
+            os.replace(wav_path, backup_path)
+            logger.info(f"{wav_path.name}: created backup {backup_path.name}")
+        os.replace(tmp_path, wav_path)
+
+        logger.info(f"{wav_path.name}: ✓ fixed, now 1 channel (mono), {sample_rate}Hz")
         return True
 
     except Exception as e:
-        logger.error(f"  ✗ Error fixing {wav_path.name}: {e}")
+        logger.error(f"{wav_path.name}: ✗ error fixing: {e}")
         return False
 
 
@@ -64,15 +103,16 @@ def main():
         logger.warning("No recordings found to fix")
         return
 
-    logger.info(f"Found {len(recordings)} recordings to check/fix\n")
+    logger.info(f"Found {len(recordings)} recordings to check/fix")
+
+    # Each recording is independent, so fix them across worker processes
+    workers = min(len(recordings), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(fix_recording, recordings))
 
-    fixed_count = 0
-    for recording in recordings:
-        if fix_recording(recording):
-            fixed_count += 1
-        print()
+    fixed_count = sum(results)
 
-    logger.info(f"\nDone! Fixed {fixed_count} recordings")
+    logger.info(f"Done! Fixed {fixed_count} recordings")
     logger.info(f"Originals backed up as *.wav.backup")
 
 
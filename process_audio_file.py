@@ -19,8 +19,11 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# How often the status window picks up the latest pipeline status (ms)
+STATUS_POLL_MS = 200
 
-def process_audio_file(audio_file_path: str):
+
+def process_audio_file(audio_file_path: str, wait_on_exit: bool = True):
     """
     Process an uploaded audio file through the full production pipeline:
       split into 30s chunks → transcribe_chunk() → analyze_chunk()
@@ -28,6 +31,8 @@ def process_audio_file(audio_file_path: str):
 
     Args:
         audio_file_path: Path to the audio file (WAV, M4A, MP3, etc.)
+        wait_on_exit: Keep the status window up for a few seconds at the end
+            (interactive runs only; scripted runs exit immediately)
     """
     import tkinter as tk
 
@@ -44,12 +49,12 @@ def process_audio_file(audio_file_path: str):
     print("(same as live recording — this may take several minutes)\n")
 
     # --- Status window ---
-    status_window = None
-    status_label = None
-    progress_label = None
+    # The pipeline only records the latest status here; the window thread
+    # polls it, so no Tk calls are made from the processing thread.
+    status_lock = threading.Lock()
+    latest_status = {'step': "Starting...", 'progress': "", 'close': False}
 
     def create_status_window():
-        nonlocal status_window, status_label, progress_label
         status_window = tk.Tk()
         status_window.title("Pilot — Processing Upload")
         status_window.geometry("440x140")
@@ -74,7 +79,20 @@ def process_audio_file(audio_file_path: str):
             font=("Arial", 8), fg="gray"
         ).pack(pady=(4, 0))
 
+        def poll_status():
+            with status_lock:
+                step = latest_status['step']
+                progress = latest_status['progress']
+                close = latest_status['close']
+            if close:
+                status_window.destroy()
+                return
+            status_label.config(text=step)
+            progress_label.config(text=progress)
+            status_window.after(STATUS_POLL_MS, poll_status)
+
         status_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        poll_status()
         status_window.mainloop()
 
     window_thread = threading.Thread(target=create_status_window, daemon=True)
@@ -83,16 +101,9 @@ def process_audio_file(audio_file_path: str):
 
     def update_status(step: str, done: int = 0, total: int = 0):
         """Thread-safe status update."""
-        if status_label and status_window:
-            try:
-                status_label.config(text=step)
-                if total:
-                    progress_label.config(text=f"Chunk {done} of {total}")
-                else:
-                    progress_label.config(text="")
-                status_window.update()
-            except Exception:
-                pass
+        with status_lock:
+            latest_status['step'] = step
+            latest_status['progress'] = f"Chunk {done} of {total}" if total else ""
         if total:
             print(f"  [{done}/{total}] {step}")
         else:
@@ -140,21 +151,22 @@ def process_audio_file(audio_file_path: str):
         update_status(f"ERROR: {str(e)[:60]}")
 
     finally:
-        time.sleep(5)
-        if status_window:
-            try:
-                status_window.destroy()
-            except Exception:
-                pass
+        # Give a person time to read the final status; don't stall scripts
+        if wait_on_exit and sys.stdout.isatty():
+            time.sleep(5)
+        with status_lock:
+            latest_status['close'] = True
+        window_thread.join(timeout=1)
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print("\nUsage: python process_audio_file.py <path_to_audio_file>")
+    args = [arg for arg in sys.argv[1:] if arg != '--no-wait']
+    if not args:
+        print("\nUsage: python process_audio_file.py <path_to_audio_file> [--no-wait]")
         print("\nSupported formats: WAV, M4A (iPhone voice memos), MP3, etc.")
         print("\nExample:")
         print("  python process_audio_file.py \"C:\\Users\\YourName\\Downloads\\meeting.m4a\"")
         print()
         sys.exit(1)
 
-    process_audio_file(sys.argv[1])
+    process_audio_file(args[0], wait_on_exit='--no-wait' not in sys.argv)
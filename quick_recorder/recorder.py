@@ -6,6 +6,7 @@ import numpy as np
 import tkinter as tk
 from datetime import datetime
 import threading
+import queue
 import logging
 from pathlib import Path
 import pytz
@@ -18,6 +19,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Global start/stop shortcut (pynput hotkey syntax)
+HOTKEY = '<ctrl>+<shift>+r'
+
+# Recording filenames use Central Time ("...CT_91min.wav")
+CHICAGO_TZ = pytz.timezone('America/Chicago')
+
+# Frames per audio callback (~186ms at 44.1kHz). Latency doesn't matter when
+# recording to a file, and larger blocks mean far fewer Python callbacks.
+AUDIO_BLOCKSIZE = 8192
+
+# How often the UI thread checks for queued notifications (ms)
+NOTIFICATION_POLL_MS = 100
+
 
 class RecordingIndicator:
     """Blinking red indicator overlay."""
@@ -91,12 +105,26 @@ class QuickRecorder:
     def __init__(self):
         """Initialize recorder."""
         self.is_recording = False
-        self.audio_data = []
         self.sample_rate = 44100
+
+        # Audio blocks are handed from the stream callback to a writer thread
+        # that streams them to disk, so memory use stays flat for any length.
+        # Each recording gets its own queue/file so a previous one can still
+        # be finalizing while the next starts.
+        self._block_queue = None
+        self._writer_thread = None
+        self._sound_file = None
+        self._temp_path = None
         self.recording_start_time = None
         self.indicator = None
         self.indicator_thread = None
 
+        # One long-lived, hidden Tk root hosts every notification popup
+        self._root = None
+        self._notifications = queue.Queue()
+        self._ui_thread = threading.Thread(target=self._run_ui, daemon=True)
+        self._ui_thread.start()
+
         # Output directory
         self.output_dir = Path.home() / "Documents" / "Sound Recordings"
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -117,8 +145,22 @@ class QuickRecorder:
 
         logger.info("Starting recording...")
         self.is_recording = True
-        self.audio_data = []
-        self.recording_start_time = datetime.now(pytz.timezone('America/Chicago'))
+        self.recording_start_time = datetime.now(CHICAGO_TZ)
+
+        # Stream to a temp file; it is renamed once the duration is known
+        self._temp_path = self.output_dir / (
+            f"{self.recording_start_time.strftime('%d%b%Y_%H.%M.%S')}CT_in_progress.wav"
+        )
+        self._sound_file = sf.SoundFile(
+            str(self._temp_path), mode='w', samplerate=self.sample_rate, channels=1
+        )
+        self._block_queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._write_loop,
+            args=(self._block_queue, self._sound_file),
+            daemon=True
+        )
+        self._writer_thread.start()
 
         # Show "Recording started" notification
         self._show_notification("Recording started")
@@ -127,6 +169,7 @@ class QuickRecorder:
         self.stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=1,
+            blocksize=AUDIO_BLOCKSIZE,
             callback=self._audio_callback
         )
         self.stream.start()
@@ -156,7 +199,7 @@ class QuickRecorder:
             self.indicator.hide()
 
         # Calculate duration
-        recording_end_time = datetime.now(pytz.timezone('America/Chicago'))
+        recording_end_time = datetime.now(CHICAGO_TZ)
         duration = recording_end_time - self.recording_start_time
         duration_minutes = int(duration.total_seconds() / 60)
 
@@ -167,13 +210,31 @@ class QuickRecorder:
         )
         filepath = self.output_dir / filename
 
-        # Save audio
-        if self.audio_data:
-            audio_array = np.concatenate(self.audio_data, axis=0)
-            sf.write(str(filepath), audio_array, self.sample_rate)
+        # Flush and rename on a separate thread so the hotkey handler returns
+        # immediately. Non-daemon: the process waits for the file to be saved.
+        threading.Thread(
+            target=self._finalize_recording,
+            args=(
+                self._block_queue, self._writer_thread, self._sound_file,
+                self._temp_path, filepath, duration_minutes
+            ),
+            daemon=False
+        ).start()
+
+    def _finalize_recording(self, block_queue, writer_thread, sound_file,
+                            temp_path, filepath, duration_minutes):
+        """Drain the writer, close the file, and move it to its final name."""
+        block_queue.put(None)
+        writer_thread.join()
+        frames_written = sound_file.frames
+        sound_file.close()
+
+        if frames_written:
+            temp_path.replace(filepath)
             logger.info(f"Recording saved: {filepath}")
             self._show_notification(f"Saved: {duration_minutes}min")
         else:
+            temp_path.unlink(missing_ok=True)
             logger.warning("No audio data recorded")
 
     def _audio_callback(self, indata, frames, time_info, status):
@@ -181,45 +242,94 @@ class QuickRecorder:
         if status:
             logger.warning(f"Audio status: {status}")
         if self.is_recording:
-            self.audio_data.append(indata.copy())
+            self._block_queue.put(indata.copy())
+
+    def _write_loop(self, block_queue, sound_file):
+        """Write queued audio blocks to disk until a None sentinel arrives."""
+        done = False
+        while not done:
+            # Take everything queued so far and write it in one call
+            blocks = [block_queue.get()]
+            while True:
+                try:
+                    blocks.append(block_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if blocks[-1] is None:
+                blocks.pop()
+                done = True
+            if not blocks:
+                continue
+
+            if len(blocks) == 1:
+                sound_file.write(blocks[0])
+                continue
+
+            # Copy blocks into one preallocated array (cheaper than np.concatenate)
+            total = sum(len(b) for b in blocks)
+            out = np.empty((total, blocks[0].shape[1]), dtype=blocks[0].dtype)
+            pos = 0
+            for b in blocks:
+                out[pos:pos + len(b)] = b
+                pos += len(b)
+            sound_file.write(out)
+
+    def _run_ui(self):
+        """Own the notification Tk root and its mainloop (UI thread)."""
+        self._root = tk.Tk()
+        self._root.withdraw()
+        self._poll_notifications()
+        self._root.mainloop()
+
+    def _poll_notifications(self):
+        """Show any queued notifications, then check again shortly."""
+        while True:
+            try:
+                message = self._notifications.get_nowait()
+            except queue.Empty:
+                break
+            self._build_notification(message)
+        self._root.after(NOTIFICATION_POLL_MS, self._poll_notifications)
 
     def _show_notification(self, message):
         """Show temporary notification."""
-        def show():
-            notif = tk.Tk()
-            notif.title("")
-            notif.overrideredirect(True)
-            notif.attributes('-topmost', True)
-            notif.attributes('-alpha', 0.9)
-
-            # Position at bottom-right
-            width = 200
-            height = 60
-            screen_width = notif.winfo_screenwidth()
-            screen_height = notif.winfo_screenheight()
-            x = screen_width - width - 10
-            y = screen_height - height - 110
-
-            notif.geometry(f"{width}x{height}+{x}+{y}")
-
-            frame = tk.Frame(notif, bg='#2C3E50')
-            frame.pack(fill=tk.BOTH, expand=True)
-
-            label = tk.Label(
-                frame,
-                text=message,
-                bg='#2C3E50',
-                fg='white',
-                font=('Segoe UI', 11, 'bold'),
-                pady=20
-            )
-            label.pack()
-
-            # Auto-close after 3 seconds
-            notif.after(3000, notif.destroy)
-            notif.mainloop()
-
-        threading.Thread(target=show, daemon=True).start()
+        # Tk is not thread-safe, so hand the message to the UI thread
+        self._notifications.put(message)
+
+    def _build_notification(self, message):
+        """Build a notification window on the shared root (UI thread only)."""
+        notif = tk.Toplevel(self._root)
+        notif.title("")
+        notif.overrideredirect(True)
+        notif.attributes('-topmost', True)
+        notif.attributes('-alpha', 0.9)
+
+        # Position at bottom-right
+        width = 200
+        height = 60
+        screen_width = notif.winfo_screenwidth()
+        screen_height = notif.winfo_screenheight()
+        x = screen_width - width - 10
+        y = screen_height - height - 110
+
+        notif.geometry(f"{width}x{height}+{x}+{y}")
+
+        frame = tk.Frame(notif, bg='#2C3E50')
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        label = tk.Label(
+            frame,
+            text=message,
+            bg='#2C3E50',
+            fg='white',
+            font=('Segoe UI', 11, 'bold'),
+            pady=20
+        )
+        label.pack()
+
+        # Auto-close after 3 seconds
+        notif.after(3000, notif.destroy)
 
     def _open_recordings_folder(self):
         """Open recordings folder when indicator is clicked."""
@@ -233,22 +343,7 @@ class QuickRecorder:
         """Run the recorder with keyboard listener."""
         logger.info("Quick Recorder ready! Press Ctrl+Shift+R to start/stop recording")
 
-        def on_activate():
-            self.toggle_recording()
-
-        # Set up hotkey
-        hotkey = keyboard.HotKey(
-            keyboard.HotKey.parse('<ctrl>+<shift>+r'),
-            on_activate
-        )
-
-        def for_canonical(f):
-            return lambda k: f(listener.canonical(k))
-
-        with keyboard.Listener(
-            on_press=for_canonical(hotkey.press),
-            on_release=for_canonical(hotkey.release)
-        ) as listener:
+        with keyboard.GlobalHotKeys({HOTKEY: self.toggle_recording}) as listener:
             listener.join()
 
 
@@ -1,9 +1,17 @@
 """Recover and process failed meeting from audio chunks."""
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import json
 
+# Optional: orjson serializes the meeting data much faster (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
@@ -11,6 +19,50 @@ from src.transcription import Transcriber
 from src.ai_analyzer import MeetingAnalyzer
 from src.config import Config
 
+# Chunks are transcribed concurrently, then analyzed together in one batch
+TRANSCRIBE_WORKERS = 4
+# Recovery works through a fixed set of chunks, so allow a higher call rate
+# than the live-recording default
+TRANSCRIBE_CALLS_PER_MINUTE = 30
+# Chunks are uploaded at 16 kHz; the transcription model works at that rate
+TRANSCRIBE_SAMPLE_RATE = 16000
+
+def _write_json(path: Path, data: dict):
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+def _load_checkpoint(path: Path) -> dict:
+    """Load transcriptions saved by an earlier, interrupted run (chunk name -> transcription)."""
+    done = {}
+    if not path.exists():
+        return done
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial last line from a crash
+
+            transcription = record['transcription']
+            transcription['chunk_filename'] = Path(transcription['chunk_filename'])
+            transcription['chunk_timestamp'] = datetime.fromisoformat(transcription['chunk_timestamp'])
+            done[record['chunk']] = transcription
+
+    return done
+
+def _append_checkpoint(f, chunk_name: str, transcription: dict):
+    """Append one transcription to the checkpoint file and force it to disk."""
+    record = {'chunk': chunk_name, 'transcription': transcription}
+    f.write(json.dumps(record, default=str) + '\n')
+    f.flush()
+    os.fsync(f.fileno())
+
 def recover_meeting(start_time: str, end_time: str):
     """
     Recover a meeting from saved audio chunks.
@@ -25,16 +77,18 @@ def recover_meeting(start_time: str, end_time: str):
     print(f"Processing chunks from {start_time} to {end_time}")
     print()
 
-    # Find all chunks in time range
+    # Find chunks in time range: filter on the chunk_YYYYMMDD_HHMMSS.wav name
+    # before building paths, and sort only the matches
     recordings_dir = Config.RECORDINGS_DIR
-    all_chunks = sorted(recordings_dir.glob("chunk_*.wav"))
-
-    # Filter by time range
     target_chunks = []
-    for chunk in all_chunks:
-        chunk_time = chunk.stem.replace("chunk_", "")
-        if start_time <= chunk_time <= end_time:
-            target_chunks.append(chunk)
+    if recordings_dir.exists():
+        with os.scandir(recordings_dir) as entries:
+            target_chunks = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("chunk_") and entry.name.endswith(".wav")
+                and start_time <= entry.name[6:-4] <= end_time
+            )
 
     if not target_chunks:
         print(f"[ERROR] No chunks found in time range {start_time} to {end_time}")
@@ -44,52 +98,72 @@ def recover_meeting(start_time: str, end_time: str):
     print()
 
     # Initialize components
-    transcriber = Transcriber()
+    transcriber = Transcriber(max_calls_per_minute=TRANSCRIBE_CALLS_PER_MINUTE)
     analyzer = MeetingAnalyzer()
 
     transcriptions = []
     analyses = []
 
-    # Process each chunk
-    for idx, chunk_path in enumerate(target_chunks, 1):
-        percentage = int((idx / len(target_chunks)) * 100)
-        print(f"[{idx}/{len(target_chunks)}] ({percentage}%) Processing: {chunk_path.name}")
+    # Transcriptions are checkpointed as they finish so a crashed run can resume
+    checkpoint_path = Config.MEETINGS_DIR / f"meeting_{start_time}_recovered.partial.jsonl"
+    checkpointed = _load_checkpoint(checkpoint_path)
+    if checkpointed:
+        print(f"Resuming: {len(checkpointed)} chunks already transcribed")
+        print()
 
-        try:
-            # Transcribe
-            print(f"  > Transcribing...")
-            chunk_info = {
+    # Transcribe every chunk concurrently; results are collected in chunk order
+    with ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS) as executor, \
+            open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+        futures = [
+            None if chunk_path.name in checkpointed else
+            executor.submit(transcriber.transcribe_chunk, {
                 'filename': chunk_path,
                 'duration': 30,  # 30-second chunks
-                'timestamp': datetime.now()
-            }
-            transcription = transcriber.transcribe_chunk(chunk_info)
-
-            if transcription and transcription.get('text'):
-                transcriptions.append(transcription)
-                print(f"  + Transcribed: {len(transcription['text'])} characters")
-
-                # Analyze
-                print(f"  > Analyzing...")
-                analysis = analyzer.analyze_chunk(transcription['text'])
-
-                if analysis:
-                    analyses.append({
-                        'timestamp': datetime.now(),
-                        'analysis': analysis
-                    })
-                    action_count = len(analysis.get('action_items', []))
-                    decision_count = len(analysis.get('decisions', []))
-                    print(f"  + Analyzed: {action_count} action items, {decision_count} decisions")
+                'timestamp': datetime.now(),
+                'upload_sample_rate': TRANSCRIBE_SAMPLE_RATE
+            })
+            for chunk_path in target_chunks
+        ]
+
+        for idx, (chunk_path, future) in enumerate(zip(target_chunks, futures), 1):
+            percentage = int((idx / len(target_chunks)) * 100)
+            print(f"[{idx}/{len(target_chunks)}] ({percentage}%) Transcribing: {chunk_path.name}")
+
+            if future is None:
+                transcriptions.append(checkpointed[chunk_path.name])
+                print(f"  + Restored from checkpoint")
+                continue
+
+            try:
+                transcription = future.result()
+
+                if transcription and transcription.get('text'):
+                    transcriptions.append(transcription)
+                    _append_checkpoint(checkpoint, chunk_path.name, transcription)
+                    print(f"  + Transcribed: {len(transcription['text'])} characters")
                 else:
-                    print(f"  ! Analysis failed")
-            else:
-                print(f"  ! Transcription empty or failed")
+                    print(f"  ! Transcription empty or failed")
 
-        except Exception as e:
-            print(f"  X Error: {e}")
+            except Exception as e:
+                print(f"  X Error: {e}")
 
-        print()
+    # Analyze all chunks in one offline batch (cheaper; latency does not matter here)
+    print()
+    print(f"Analyzing {len(transcriptions)} chunks via batch API (may take several minutes)...")
+    results = analyzer.analyze_chunks_batch([t['text'] for t in transcriptions])
+
+    for analysis in results:
+        if analysis:
+            analyses.append({
+                'timestamp': datetime.now(),
+                'analysis': analysis
+            })
+
+    action_count = sum(len(a['analysis'].get('action_items', [])) for a in analyses)
+    decision_count = sum(len(a['analysis'].get('decisions', [])) for a in analyses)
+    print(f"  + Analyzed {len(analyses)}/{len(transcriptions)} chunks: "
+          f"{action_count} action items, {decision_count} decisions")
+    print()
 
     # Generate summary
     print("=" * 70)
@@ -161,8 +235,10 @@ Chunks Processed: {len(transcriptions)}
         ]
     }
 
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(meeting_data, f, indent=2)
+    _write_json(data_path, meeting_data)
+
+    # Everything is saved; the checkpoint is no longer needed
+    checkpoint_path.unlink(missing_ok=True)
 
     # Copy to Downloads
     try:
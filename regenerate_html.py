@@ -1,5 +1,7 @@
 """Regenerate HTML for existing meeting."""
 
+import json
+import os
 import sys
 from pathlib import Path
 
@@ -33,21 +35,34 @@ meeting_id = latest_md.stem.replace('meeting_', '')
 snippets_dir = Config.SNIPPETS_DIR
 
 snippet_paths = {}
-if snippets_dir.exists():
-    for snippet_file in snippets_dir.glob(f"snippet_{meeting_id.replace('-', '')}*.wav"):
-        # Extract action item ID from filename (would need actual mapping)
-        # For now, just collect all snippets with proper IDs
-        print(f"Found snippet: {snippet_file.name}")
-
-        # Parse the snippet filename to get the chunk timestamp and text
-        # Format: snippet_YYYYMMDD_HHMMSS_mmm_text.wav
-        parts = snippet_file.stem.split('_')
-        if len(parts) >= 4:
-            # Create a hash from the text portion (simplified)
-            import hashlib
-            text_part = '_'.join(parts[4:])  # Everything after timestamp
-            action_hash = hashlib.md5(text_part.encode()).hexdigest()[:8]
-            snippet_paths[action_hash] = snippet_file
+index_file = Config.SNIPPETS_INDEX_FILE
+snippets_index = {}
+if index_file.exists():
+    with open(index_file, 'r', encoding='utf-8') as f:
+        snippets_index = json.load(f)
+
+if meeting_id in snippets_index:
+    # Mapping written by MeetingManager when the snippets were produced - no need
+    # to rescan or rehash
+    snippet_paths = {
+        action_hash: snippets_dir / filename
+        for action_hash, filename in snippets_index[meeting_id].items()
+    }
+elif snippets_dir.exists():
+    # Older meeting with no index entry: the scan result is used for this run
+    # only and never written to the index (MeetingManager is its only writer)
+
+    # Collect this meeting's snippets. Filenames hold only truncated,
+    # sanitized action text, so real action item IDs cannot be rebuilt from
+    # them; key by filename and let the generator match snippets by text
+    # Format: snippet_YYYYMMDD_HHMMSS_mmm_text.wav
+    prefix = f"snippet_{meeting_id.replace('-', '')}"
+    with os.scandir(snippets_dir) as entries:
+        snippet_paths = {
+            entry.name: snippets_dir / entry.name
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith('.wav')
+        }
 
 print(f"Found {len(snippet_paths)} snippets")
 
@@ -70,7 +85,6 @@ if html_path:
     print(f"Copied to Downloads: {downloads_path}")
 
     # Open in browser
-    import os
     if sys.platform == 'win32':
         os.startfile(downloads_path)
     print("\nOpened in your default browser!")
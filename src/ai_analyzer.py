@@ -1,21 +1,318 @@
 """AI analysis module using Claude API for meeting insights."""
 
+import atexit
+import hashlib
 import json
 import logging
+import re
+import threading
 import time
-from typing import Optional, Dict, List
-from datetime import datetime
-from anthropic import Anthropic, APIError
-
+import traceback
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import chain, islice
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Dict, List
+import numpy as np
+from anthropic import Anthropic, APIError, DefaultHttpxClient
+
+# Optional: orjson renders the status check data much faster (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .audio_snippet_extractor import action_item_id
 from .config import Config
 from .rate_limiter import APIRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Haiku for cost-efficient chunk analysis
+CHUNK_ANALYSIS_MODEL = "claude-haiku-4-5-20251001"
+
+# One keep-alive connection pool (SDK default limits/timeouts) shared by every
+# Anthropic client in the process, so repeated calls skip the TCP/TLS handshake
+SHARED_HTTP_CLIENT = DefaultHttpxClient()
+atexit.register(SHARED_HTTP_CLIENT.close)
+
+# Action item line in a summary: "- [ ] [Assignee]: [Action] (Due: ...) ..."
+_ACTION_LINE_RE = re.compile(r'- \[ \] (?:([^:]+): )?(.+?)(?:\s*\(Due:|$)')
+
+# ACTION ITEMS section of a summary: heading line, then everything up to the
+# next DECISIONS / ITEMS REQUIRING CLARIFICATION heading or ━━━ divider
+_ACTION_BLOCK_RE = re.compile(
+    r'(^[ \t]*ACTION ITEMS[ \t]*(?:\n|\Z))(.*?)'
+    r'(?=^[ \t]*(?:DECISIONS|ITEMS REQUIRING CLARIFICATION)[ \t]*$|^━━━|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+# Checkbox action item line within that section
+_ACTION_ITEM_RE = re.compile(r'^[ \t]*- \[ \].*$', re.MULTILINE)
+
+# Reused for pulling the JSON object out of Claude's responses
+_JSON_DECODER = json.JSONDecoder()
+
+# Transcript chunks kept in the rolling analysis context
+CONTEXT_HISTORY_CHUNKS = 10
+
+# Cleaned transcripts remembered per analyzer (keyed by raw-text hash)
+CLEAN_CACHE_SIZE = 8
+
+# Status check / query responses kept for reuse, and for how long (seconds)
+COMPLETION_CACHE_SIZE = 128
+COMPLETION_CACHE_TTL = 60.0
+
+
+# Status check confidence: each count earns the score at its threshold bracket
+# (below the first threshold, between them, at/above the last)
+_MEETING_THRESHOLDS = (2, 5)
+_MEETING_SCORES = (0, 15, 30)
+_SUMMARY_THRESHOLDS = (1, 3)
+_SUMMARY_SCORES = (0, 15, 30)
+_ACTION_THRESHOLDS = (2, 5)
+_ACTION_SCORES = (0, 20, 40)
+
+# Total score brackets -> (confidence label, explanation template)
+_CONFIDENCE_THRESHOLDS = (40, 70)
+_CONFIDENCE_LEVELS = (
+    ("LOW", "Insufficient data: Only {meetings} meetings recorded. Status check may be incomplete."),
+    ("MEDIUM", "Limited data: {meetings} meetings, {action_items} action items. May miss some context."),
+    ("HIGH", "Based on {meetings} meetings with {action_items} action items."),
+)
+
+
+def _dumps_indented(data) -> str:
+    """Render data as indented JSON text for a prompt, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _system_blocks() -> List[Dict]:
+    """System prompt as a content block marked for Anthropic prompt caching."""
+    return [{
+        "type": "text",
+        "text": Config.PILOT_SYSTEM_CONTEXT,
+        "cache_control": {"type": "ephemeral"}
+    }]
+
+
+@lru_cache(maxsize=4)
+def _format_now(ts_seconds: int) -> tuple:
+    """
+    Format the current time for the status check prompt (cached per second).
+
+    Args:
+        ts_seconds: Current Unix time, truncated to whole seconds
+
+    Returns:
+        (display string like "February 16, 2026 at 2:45 PM CT",
+         today as YYYY-MM-DD, yesterday as YYYY-MM-DD)
+    """
+    current_datetime = datetime.fromtimestamp(ts_seconds)
+    return (
+        current_datetime.strftime("%B %d, %Y at %I:%M %p CT"),
+        current_datetime.strftime("%Y-%m-%d"),
+        (current_datetime - timedelta(days=1)).strftime("%Y-%m-%d")
+    )
+
+
+# Fixed instructions that close every status check prompt ({timezone} is the
+# user's timezone abbreviation); see _status_prompt_tail()
+_STATUS_PROMPT_TAIL = """
+Generate a PROJECT MANAGEMENT STATUS REPORT with these EXACT sections:
+
+═══════════════════════════════════════════════════════════
+EXECUTIVE SUMMARY:
+═══════════════════════════════════════════════════════════
+(2-3 sentences: Current project state based ONLY on what was STATED in meetings)
+CRITICAL: Include confidence level for project phase:
+- If phase explicitly stated: "[HIGH] Project phase: Testing (stated in 2/15 meeting)"
+- If phase unclear: "[UNCLEAR] Project phase not explicitly discussed in recent meetings"
+- If inferring: "[LOW - INFERRED] Project appears to be in X phase based on Y discussion"
+
+DO NOT STATE: "System is live" unless explicitly confirmed in a meeting
+DO NOT ASSUME: Go-live status, launch dates, or phases without clear evidence
+
+
+═══════════════════════════════════════════════════════════
+MY ACTION ITEMS:
+═══════════════════════════════════════════════════════════
+ONLY list items EXPLICITLY mentioned in action items data.
+Group by urgency:
+[URGENT] items - flag ONLY if explicitly marked urgent, blocking, or time-sensitive in data
+[NORMAL] items - all other action items
+
+Format: "- [URGENT/NORMAL] Task description (Meeting 2/15 3:30pm)"
+MUST include specific meeting date/time for each item
+If no clear owner in data, flag as "[NO OWNER]"
+DO NOT create action items not in the data
+
+
+═══════════════════════════════════════════════════════════
+WAITING ON OTHERS:
+═══════════════════════════════════════════════════════════
+List items assigned to other people/teams with:
+- Who: Task description (requested MM/DD)
+
+
+═══════════════════════════════════════════════════════════
+UPCOMING DEADLINES & DATES:
+═══════════════════════════════════════════════════════════
+ONLY list dates EXPLICITLY mentioned in meeting data:
+- MM/DD: What's due/happening [HIGH - stated in Meeting 2/XX]
+If date was implied but not stated: "[MEDIUM - implied from discussion in Meeting 2/XX]"
+Flag if overdue or coming up in next 2 weeks (based on report generation date)
+If NO dates mentioned, write: "No specific dates or deadlines mentioned in recent meetings"
+DO NOT infer dates not explicitly stated
+
+
+═══════════════════════════════════════════════════════════
+RECENT DECISIONS (Last 3 Meetings):
+═══════════════════════════════════════════════════════════
+Key decisions made:
+- Decision description (MM/DD meeting)
+
+
+═══════════════════════════════════════════════════════════
+BLOCKERS & RISKS:
+═══════════════════════════════════════════════════════════
+ONLY list blockers/risks EXPLICITLY mentioned or clearly implied:
+- Blocker/risk description [confidence level] (Meeting reference)
+
+Examples:
+"- Waiting on McKesson training dates [HIGH - explicitly stated as blocking in 2/13 meeting]"
+"- Budget approval pending [MEDIUM - mentioned in 2/10, 2/12 meetings, blocking inference]"
+
+If NO blockers mentioned: "No explicit blockers identified in recent meetings"
+DO NOT assume blockers from absence of updates
+
+
+═══════════════════════════════════════════════════════════
+WHAT'S NEXT - SPECIFIC ACTIONS:
+═══════════════════════════════════════════════════════════
+Based ONLY on action items and discussions in meeting data:
+- [ ] Action derived from open action items (Meeting reference)
+- [ ] Follow-up based on "waiting on" items (Meeting reference)
+
+Mark as [SUGGESTED] if inferring next step not explicitly stated
+Examples:
+"- [ ] Follow up with McKesson on dates [HIGH - action item from 2/13]"
+"- [ ] [SUGGESTED] Schedule check-in meeting [LOW - inferred from lack of updates]"
+
+If no clear next steps in data: "Next steps not explicitly defined in recent meetings"
+
+
+═══════════════════════════════════════════════════════════
+KEY METRICS:
+═══════════════════════════════════════════════════════════
+- Open action items: X (from action items data)
+- Meetings analyzed: X (from meeting count)
+- Decisions made (last 3 meetings): X
+- Trend assessment:
+  * Use [HIGH] for clearly evident trends from data
+  * Use [MEDIUM] for inferred trends with some evidence
+  * Use [LOW] for weak inferences
+  * Examples:
+    - "Making progress [MEDIUM - 5 of 8 items completed based on discussion]"
+    - "Status unclear [LOW - insufficient updates in recent meetings]"
+    - "Blocked [HIGH - McKesson dependency explicitly stated as blocker]"
+
+
+CRITICAL INSTRUCTIONS - ACCURACY REQUIREMENTS:
+- Use EXACT section headers with separators (═══)
+- ONLY state facts explicitly mentioned in meeting data
+- Include meeting reference for EVERY fact: "(Meeting 2/15 12:30pm)" or "(from 2/15 meeting)"
+- Use confidence tags: [HIGH], [MEDIUM], [LOW], [UNCLEAR]
+- Mark inferences: "[INFERRED from discussion about X]"
+- If project status/phase unclear, say so explicitly
+- Be SPECIFIC with meeting dates, names, deadlines
+- Flag URGENT items with [URGENT]
+- If section has no data, write "None identified" or "Not discussed in meetings"
+- DO NOT hallucinate facts - better to say "Unknown" or "Unclear"
+- DO NOT assume current status unless explicitly stated
+- Prioritize ACCURACY over completeness
+- Format for easy scanning (bullet points, clear structure)
+
+EXAMPLES OF PROPER DATE/TIME FORMATTING:
+✓ GOOD: "Meeting 2/15 (yesterday) at 1:23 PM {timezone}"
+✓ GOOD: "Deadline Feb 18 (in 2 days) at 5:00 PM {timezone}"
+✓ GOOD: "Last discussed 2/13 (3 days ago)"
+✗ BAD: "Meeting at 13:23" (no timezone, 24-hour format)
+✗ BAD: "Meeting at 1:23 PM" (no timezone)
+✗ BAD: "Follow-up by 2/18" (no relative time, no timezone)
+
+EXAMPLES OF PROPER GROUNDING:
+✓ GOOD: "Launch: Week of Feb 24 [HIGH - stated by [MANAGER] in 2/15 meeting at 2:30 PM {timezone}]"
+✓ GOOD: "[UNCLEAR] Current go-live status - not discussed in recent meetings"
+✓ GOOD: "Training mentioned [MEDIUM - implied from action item in 2/13 meeting]"
+✗ BAD: "System is currently live" (not stated anywhere)
+✗ BAD: "Project in operational phase" (assumption)
+✗ BAD: "Launch successful" (not confirmed)"""
+
+
+@lru_cache(maxsize=None)
+def _status_prompt_tail(timezone: str) -> str:
+    """Status check instructions with the user's timezone filled in (cached per timezone)."""
+    return _STATUS_PROMPT_TAIL.format(timezone=timezone)
+
 
 class MeetingAnalyzer:
     """Analyzes meeting transcriptions using Claude AI."""
 
+    # Static parts of the chunk analysis prompt, built once; only the context
+    # and transcription in between change per chunk
+    _PROMPT_PREFIX = "You are analyzing a meeting transcription in real-time."
+
+    _PROMPT_SUFFIX = """Extract the following with HIGH PRIORITY on action items and decisions:
+
+1. **Action Items**: Tasks, follow-ups, or deliverables. Include:
+   - What needs to be done
+   - Who is responsible (if mentioned)
+   - Deadline/timeframe (if mentioned)
+   - Confidence: "high" if clearly stated, "medium" if implied, "low" if uncertain
+
+2. **Decisions**: Any decisions made or agreed upon. Include:
+   - The decision
+   - Confidence: "high" if clearly stated, "medium" if implied
+
+3. **Key Points**: Important discussion topics (REMS requirements, training, FDA compliance, safety, logistics)
+
+4. **Participants**: Names and roles if identifiable
+
+5. **Unclear Items**: Flag anything ambiguous, missing context, or requiring clarification
+
+Return as JSON:
+{
+  "action_items": [
+    {
+      "item": "description",
+      "assignee": "name or null",
+      "deadline": "timeframe or null",
+      "confidence": "high/medium/low"
+    }
+  ],
+  "decisions": [
+    {
+      "decision": "what was decided",
+      "confidence": "high/medium"
+    }
+  ],
+  "key_points": ["point 1", "point 2"],
+  "participants": ["name (role if known)"],
+  "unclear_items": ["what's unclear or needs clarification"]
+}
+
+Focus on:
+- Compliance and regulatory requirements
+- Training and certification
+- Approval and authorization items
+- Documentation and reporting needs
+- Safety and risk-related items
+- Timelines and deadlines"""
+
     def __init__(self, api_key: Optional[str] = None, max_calls_per_minute: int = 10):
         """
         Initialize analyzer.
@@ -28,11 +325,11 @@ class MeetingAnalyzer:
         if not self.api_key:
             raise ValueError("Anthropic API key is required")
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = Anthropic(api_key=self.api_key, http_client=SHARED_HTTP_CLIENT)
         self.model = "claude-sonnet-4-6"
 
-        # Context management
-        self.conversation_history: List[str] = []
+        # Context management (history is bounded; old chunks drop off the left)
+        self.conversation_history: deque = deque(maxlen=CONTEXT_HISTORY_CHUNKS)
         self.meeting_context = {
             'action_items': [],
             'decisions': [],
@@ -44,6 +341,17 @@ class MeetingAnalyzer:
         # by Claude's max_tokens output limit.
         self.last_full_transcript: str = ""
 
+        # Haiku cleanup results, so regenerating a summary skips the repeat call
+        self._clean_cache: "OrderedDict[str, str]" = OrderedDict()
+
+        # Recent status check / query responses: prompt hash -> (time, text)
+        self._completion_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._completion_lock = threading.Lock()
+
+        # Rendered _build_context() output, rebuilt only after _update_context()
+        self._context_cache = ""
+        self._context_dirty = True
+
         # API RATE LIMITING - Prevent IP bans and runaway costs
         self.rate_limiter = APIRateLimiter(
             max_calls_per_minute=max_calls_per_minute,
@@ -108,10 +416,10 @@ class MeetingAnalyzer:
 
                 # Call Claude API
                 response = self.client.messages.create(
-                    model="claude-haiku-4-5-20251001",  # Haiku for cost-efficient chunk analysis
+                    model=CHUNK_ANALYSIS_MODEL,
                     max_tokens=2000,
                     temperature=0.3,  # Lower temperature for more focused extraction
-                    system=Config.PILOT_SYSTEM_CONTEXT,
+                    system=_system_blocks(),
                     messages=[
                         {
                             "role": "user",
@@ -174,99 +482,142 @@ class MeetingAnalyzer:
 
         return None
 
-    def _create_analysis_prompt(self, transcription: str, context: str) -> str:
-        """Create the analysis prompt for Claude."""
-        return f"""You are analyzing a meeting transcription in real-time.
-
-{'Previous meeting context:\n' + context if context else 'This is the start of the meeting.'}
-
-New transcription segment:
-\"\"\"
-{transcription}
-\"\"\"
+    def analyze_chunks_batch(
+        self,
+        transcriptions: List[str],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0
+    ) -> List[Optional[Dict]]:
+        """
+        Analyze many transcription chunks offline via the Message Batches API.
 
-Extract the following with HIGH PRIORITY on action items and decisions:
+        Intended for recovering completed meetings, where latency does not
+        matter: all chunks go out in one batch request at reduced cost. Each
+        chunk's context is built from the preceding chunk transcripts (earlier
+        analyses are not available yet). Results are folded into the meeting
+        context in chunk order so generate_summary() works as usual.
 
-1. **Action Items**: Tasks, follow-ups, or deliverables. Include:
-   - What needs to be done
-   - Who is responsible (if mentioned)
-   - Deadline/timeframe (if mentioned)
-   - Confidence: "high" if clearly stated, "medium" if implied, "low" if uncertain
+        Args:
+            transcriptions: Transcribed text per chunk, in meeting order
+            poll_interval: Seconds before the first batch status check; the
+                wait doubles after each check up to max_poll_interval
+            max_poll_interval: Longest wait between batch status checks
 
-2. **Decisions**: Any decisions made or agreed upon. Include:
-   - The decision
-   - Confidence: "high" if clearly stated, "medium" if implied
+        Returns:
+            Analysis dict (or None if that chunk failed) per transcription
+        """
+        requests = []
+        for idx, transcription in enumerate(transcriptions):
+            if not transcription or not transcription.strip():
+                continue
+            context = self._preceding_context(transcriptions, idx)
+            requests.append({
+                "custom_id": f"chunk-{idx}",
+                "params": {
+                    "model": CHUNK_ANALYSIS_MODEL,
+                    "max_tokens": 2000,
+                    "temperature": 0.3,
+                    "system": _system_blocks(),
+                    "messages": [{
+                        "role": "user",
+                        "content": self._create_analysis_prompt(transcription, context)
+                    }]
+                }
+            })
 
-3. **Key Points**: Important discussion topics (REMS requirements, training, FDA compliance, safety, logistics)
+        results: List[Optional[Dict]] = [None] * len(transcriptions)
+        if not requests:
+            logger.warning("No non-empty transcriptions to analyze")
+            return results
 
-4. **Participants**: Names and roles if identifiable
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+            self.rate_limiter.record_call(success=True)
+            logger.info(f"Submitted analysis batch {batch.id} ({len(requests)} chunks)")
+
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+                counts = batch.request_counts
+                logger.info(f"Batch {batch.id}: {counts.processing} processing, "
+                            f"{counts.succeeded} succeeded, {counts.errored} errored")
+
+            for entry in self.client.messages.batches.results(batch.id):
+                idx = int(entry.custom_id.split("-", 1)[1])
+                if entry.result.type == "succeeded":
+                    results[idx] = self._parse_analysis_result(entry.result.message.content[0].text)
+                else:
+                    logger.error(f"Batch analysis failed for chunk {idx}: {entry.result.type}")
+
+        except APIError as e:
+            logger.error(f"Claude batch API error: {e}")
+            self.rate_limiter.record_call(success=False)
+            return results
+
+        # Fold results into the running meeting context in chunk order
+        for transcription, result in zip(transcriptions, results):
+            if result:
+                self._update_context(transcription, result)
+
+        succeeded = sum(1 for r in results if r)
+        logger.info(f"Batch analysis completed: {succeeded}/{len(requests)} chunks analyzed")
+        return results
+
+    def _preceding_context(self, transcriptions: List[str], idx: int) -> str:
+        """Build offline context for chunk idx from the up-to-3 transcripts before it."""
+        recent = [t for t in transcriptions[max(0, idx - 3):idx] if t and t.strip()]
+        if not recent:
+            return ""
+        return "Recent discussion:\n" + "\n".join(f"- {t[:200]}..." for t in recent)
 
-5. **Unclear Items**: Flag anything ambiguous, missing context, or requiring clarification
+    def _create_analysis_prompt(self, transcription: str, context: str) -> str:
+        """Create the analysis prompt for Claude."""
+        context_block = ('Previous meeting context:\n' + context) if context else 'This is the start of the meeting.'
+        return (
+            f"{self._PROMPT_PREFIX}\n\n{context_block}\n\n"
+            f"New transcription segment:\n\"\"\"\n{transcription}\n\"\"\"\n\n"
+            f"{self._PROMPT_SUFFIX}"
+        )
 
-Return as JSON:
-{{
-  "action_items": [
-    {{
-      "item": "description",
-      "assignee": "name or null",
-      "deadline": "timeframe or null",
-      "confidence": "high/medium/low"
-    }}
-  ],
-  "decisions": [
-    {{
-      "decision": "what was decided",
-      "confidence": "high/medium"
-    }}
-  ],
-  "key_points": ["point 1", "point 2"],
-  "participants": ["name (role if known)"],
-  "unclear_items": ["what's unclear or needs clarification"]
-}}
+    def _build_context(self) -> str:
+        """Build context string from conversation history (cached until the next update)."""
+        if not self._context_dirty:
+            return self._context_cache
 
-Focus on:
-- Compliance and regulatory requirements
-- Training and certification
-- Approval and authorization items
-- Documentation and reporting needs
-- Safety and risk-related items
-- Timelines and deadlines"""
+        self._context_cache = self._render_context()
+        self._context_dirty = False
+        return self._context_cache
 
-    def _build_context(self) -> str:
-        """Build context string from conversation history."""
+    def _render_context(self) -> str:
+        """Render the context string for _build_context."""
         if not self.conversation_history:
             return ""
+        return "\n".join(self._iter_context_lines())
 
-        # Use last 3 chunks for context (to avoid token limits)
-        recent_chunks = self.conversation_history[-3:]
-
-        context_parts = []
-
+    def _iter_context_lines(self):
+        """Yield the lines of the analysis context, one section at a time."""
         if self.meeting_context['action_items']:
             items = self.meeting_context['action_items'][-5:]  # Last 5 items
-            context_parts.append("Recent action items: " +
-                               ", ".join(f"{item['item']}" for item in items))
+            yield "Recent action items: " + ", ".join(str(item['item']) for item in items)
 
         if self.meeting_context['decisions']:
             decisions = self.meeting_context['decisions'][-3:]
             # Handle both dict format (new) and string format (old)
-            decision_texts = []
-            for d in decisions:
-                if isinstance(d, dict):
-                    decision_texts.append(d.get('decision', str(d)))
-                else:
-                    decision_texts.append(str(d))
-            context_parts.append("Recent decisions: " + ", ".join(decision_texts))
+            yield "Recent decisions: " + ", ".join(
+                d.get('decision', str(d)) if isinstance(d, dict) else str(d)
+                for d in decisions
+            )
 
         if self.meeting_context['participants']:
-            context_parts.append("Participants: " +
-                               ", ".join(self.meeting_context['participants']))
-
-        if recent_chunks:
-            context_parts.append("\nRecent discussion:\n" +
-                               "\n".join(f"- {chunk[:200]}..." for chunk in recent_chunks))
+            yield "Participants: " + ", ".join(self.meeting_context['participants'])
 
-        return "\n".join(context_parts)
+        # Use last 3 chunks for context (to avoid token limits)
+        history = self.conversation_history
+        yield ""
+        yield "Recent discussion:"
+        for chunk in islice(history, max(0, len(history) - 3), None):
+            yield "- " + chunk[:200] + "..."
 
     def _parse_analysis_result(self, result_text: str) -> Optional[Dict]:
         """Parse Claude's JSON response."""
@@ -274,14 +625,18 @@ Focus on:
             # Try to find JSON in the response
             # Claude might include text before/after JSON
             start_idx = result_text.find('{')
-            end_idx = result_text.rfind('}') + 1
 
-            if start_idx == -1 or end_idx == 0:
+            if start_idx == -1:
                 logger.error("No JSON found in response")
                 return None
 
-            json_str = result_text[start_idx:end_idx]
-            result = json.loads(json_str)
+            try:
+                # Decode the first complete JSON value; trailing text is ignored
+                result, _ = _JSON_DECODER.raw_decode(result_text, start_idx)
+            except json.JSONDecodeError:
+                # Fall back to the outermost braces
+                end_idx = result_text.rfind('}') + 1
+                result = json.loads(result_text[start_idx:end_idx])
 
             # Validate structure
             if not isinstance(result, dict):
@@ -304,12 +659,9 @@ Focus on:
 
     def _update_context(self, transcription: str, analysis: Dict):
         """Update conversation context with new analysis."""
-        # Add transcription to history
+        # Add transcription to history (the deque keeps only the last 10 chunks)
         self.conversation_history.append(transcription)
-
-        # Keep only recent history (last 10 chunks)
-        if len(self.conversation_history) > 10:
-            self.conversation_history = self.conversation_history[-10:]
+        self._context_dirty = True
 
         # Update meeting context
         self.meeting_context['action_items'].extend(analysis.get('action_items', []))
@@ -337,16 +689,23 @@ Focus on:
         if not raw_text or not raw_text.strip():
             return raw_text
 
+        cache_key = hashlib.blake2b(raw_text.encode(), digest_size=16).hexdigest()
+        if cache_key in self._clean_cache:
+            self._clean_cache.move_to_end(cache_key)
+            logger.info("Transcription cleanup: reusing cached result")
+            return self._clean_cache[cache_key]
+
         try:
-            # Estimate a generous output token budget (words × 1.5 + buffer)
-            word_count = len(raw_text.split())
+            # Estimate a generous output token budget (words × 1.5 + buffer).
+            # Counting spaces approximates the word count without splitting.
+            word_count = raw_text.count(' ') + 1
             max_tokens = min(8192, max(512, int(word_count * 1.5) + 300))
 
-            response = self.client.messages.create(
+            corrected = self._stream_text(
                 model="claude-haiku-4-5-20251001",
                 max_tokens=max_tokens,
                 temperature=0,
-                system=Config.PILOT_SYSTEM_CONTEXT,
+                system=_system_blocks(),
                 messages=[{
                     "role": "user",
                     "content": f"""Fix obvious ASR (automatic speech recognition) errors in this meeting transcript. Rules:
@@ -367,10 +726,13 @@ Return the corrected transcript only. No commentary, no preamble.
 Transcript:
 {raw_text}"""
                 }]
-            )
+            ).strip()
 
-            corrected = response.content[0].text.strip()
             logger.info(f"Transcription cleanup: {word_count} words cleaned via Haiku")
+
+            self._clean_cache[cache_key] = corrected
+            if len(self._clean_cache) > CLEAN_CACHE_SIZE:
+                self._clean_cache.popitem(last=False)
             return corrected
 
         except Exception as e:
@@ -449,14 +811,16 @@ Transcript:
             # Claude still receives the full transcript as input for accurate extraction,
             # but the HTML generator injects it directly from last_full_transcript.
             # This frees all 4000 output tokens for the structured sections.
-            prompt = f"""You are creating a comprehensive summary of a meeting.
+            # The transcript goes in its own cached block so a regenerated
+            # summary of the same meeting reuses it.
+            transcript_block = f"""You are creating a comprehensive summary of a meeting.
 
 Complete transcript:
 \"\"\"
 {full_transcript}
 \"\"\"
-
-CRITICAL INSTRUCTION: ONLY use names that are EXPLICITLY STATED in the transcript. NEVER invent, guess, or hallucinate names. If a name is not clearly mentioned, use descriptive placeholders like [Team member], [IT lead], [Speaker], or [Unidentified]. Accuracy is more important than specificity.
+"""
+            prompt = """CRITICAL INSTRUCTION: ONLY use names that are EXPLICITLY STATED in the transcript. NEVER invent, guess, or hallucinate names. If a name is not clearly mentioned, use descriptive placeholders like [Team member], [IT lead], [Speaker], or [Unidentified]. Accuracy is more important than specificity.
 
 Create a clean, clinical summary with this EXACT format (NO emojis, minimal formatting):
 
@@ -498,15 +862,19 @@ PARTICIPANTS
 
 Format professionally and clinically. Be specific. Use simple formatting."""
 
-            response = self.client.messages.create(
+            summary = self._stream_text(
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.3,  # Lower temperature for more factual output
-                system=Config.PILOT_SYSTEM_CONTEXT,
-                messages=[{"role": "user", "content": prompt}]
+                system=_system_blocks(),
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": transcript_block, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": prompt}
+                    ]
+                }]
             )
-
-            summary = response.content[0].text
             logger.info("Meeting summary generated successfully")
 
             # Add snippet links to action items if available
@@ -519,6 +887,28 @@ Format professionally and clinically. Be specific. Use simple formatting."""
             logger.error(f"Error generating summary: {e}")
             return self._generate_fallback_summary()
 
+    def _stream_text(self, on_text: Optional[Callable[[str], None]] = None, **params) -> str:
+        """
+        Run a messages request as a stream and return the full text.
+
+        Long outputs (summary, transcript cleanup) arrive incrementally
+        instead of in one blocking response.
+
+        Args:
+            on_text: Optional callback given each text delta as it arrives
+            **params: Arguments for client.messages.stream()
+
+        Returns:
+            Concatenated response text
+        """
+        parts = []
+        with self.client.messages.stream(**params) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                if on_text:
+                    on_text(text)
+        return "".join(parts)
+
     def _annotate_transcript_confidence(self, transcript: str, transcription_words: list = None) -> str:
         """
         Annotate transcript with footnote-style markers for low-confidence sections.
@@ -550,39 +940,40 @@ Format professionally and clinically. Be specific. Use simple formatting."""
 
         result_parts = []
         footnotes = []   # List of (marker_num, avg_conf, section_text)
-        low_conf_buffer = []
 
         LOW_CONF_THRESHOLD = 0.70  # Flag sections below 70% confidence
         VERY_LOW_THRESHOLD = 0.50  # "may be inaccurate" vs "lower confidence"
         MIN_SECTION_WORDS = 3      # Ignore very short dips (single/double words)
 
-        def flush_low_conf():
-            nonlocal low_conf_buffer
-            if not low_conf_buffer:
-                return
-            if len(low_conf_buffer) >= MIN_SECTION_WORDS:
-                avg_conf = sum(c for _, c in low_conf_buffer) / len(low_conf_buffer)
-                section_text = " ".join(w for w, _ in low_conf_buffer)
+        texts = [w.get('text', '') for w in all_words]
+        confidences = np.fromiter(
+            (w.get('confidence', 1.0) for w in all_words),
+            dtype=np.float64,
+            count=len(all_words)
+        )
+
+        # Find runs of consecutive low-confidence words: +1 marks a run start,
+        # -1 the index just past its end
+        low = (confidences < LOW_CONF_THRESHOLD).astype(np.int8)
+        edges = np.diff(np.concatenate(([0], low, [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+
+        pos = 0
+        for start, end in zip(run_starts.tolist(), run_ends.tolist()):
+            result_parts.extend(texts[pos:start])
+            if end - start >= MIN_SECTION_WORDS:
+                avg_conf = float(confidences[start:end].mean())
+                section_text = " ".join(texts[start:end])
                 marker_num = len(footnotes) + 1
                 footnotes.append((marker_num, avg_conf, section_text))
                 # Append marker directly after section text (no extra period)
                 result_parts.append(f"{section_text}[{marker_num}]")
             else:
                 # Too short to flag — include as plain text
-                result_parts.extend(w for w, _ in low_conf_buffer)
-            low_conf_buffer = []
-
-        for word_data in all_words:
-            word_text = word_data.get('text', '')
-            confidence = word_data.get('confidence', 1.0)
-
-            if confidence < LOW_CONF_THRESHOLD:
-                low_conf_buffer.append((word_text, confidence))
-            else:
-                flush_low_conf()
-                result_parts.append(word_text)
-
-        flush_low_conf()
+                result_parts.extend(texts[start:end])
+            pos = end
+        result_parts.extend(texts[pos:])
 
         annotated = " ".join(result_parts)
 
@@ -659,43 +1050,19 @@ Format professionally and clinically. Be specific. Use simple formatting."""
         if not snippet_paths:
             return summary
 
-        import hashlib
-        import re
-        from pathlib import Path
-
-        # Find the ACTION ITEMS section
-        lines = summary.split('\n')
-        result_lines = []
-        in_action_items = False
-
-        for line in lines:
-            # Check if we're in the ACTION ITEMS section
-            if line.strip() == 'ACTION ITEMS':
-                in_action_items = True
-                result_lines.append(line)
-                continue
-
-            # Check if we've left the ACTION ITEMS section
-            if in_action_items and (line.strip() == 'DECISIONS' or
-                                   line.strip() == 'ITEMS REQUIRING CLARIFICATION' or
-                                   line.startswith('━━━')):
-                in_action_items = False
-                result_lines.append(line)
-                continue
-
-            # If we're in ACTION ITEMS and it's an action item line
-            if in_action_items and line.strip().startswith('- [ ]'):
-                # Try to match the action item with a snippet
-                snippet_link = self._find_snippet_for_action_line(line, snippet_paths)
-                if snippet_link:
-                    # Add snippet link at the end of the line
-                    line = line.rstrip() + f"  \n  [🔊 Listen to context]({snippet_link})"
+        def link_line(match: re.Match) -> str:
+            line = match.group(0)
+            snippet_link = self._find_snippet_for_action_line(line, snippet_paths)
+            if snippet_link:
+                # Add snippet link at the end of the line
+                return line.rstrip() + f"  \n  [🔊 Listen to context]({snippet_link})"
+            return line
 
-                result_lines.append(line)
-            else:
-                result_lines.append(line)
+        def link_block(match: re.Match) -> str:
+            return match.group(1) + _ACTION_ITEM_RE.sub(link_line, match.group(2))
 
-        return '\n'.join(result_lines)
+        # Rewrite only the "- [ ]" lines inside each ACTION ITEMS section
+        return _ACTION_BLOCK_RE.sub(link_block, summary)
 
     def _find_snippet_for_action_line(self, action_line: str, snippet_paths: dict) -> str:
         """
@@ -708,13 +1075,9 @@ Format professionally and clinically. Be specific. Use simple formatting."""
         Returns:
             Relative path to snippet file, or empty string if not found
         """
-        import hashlib
-        import re
-        from pathlib import Path
-
         # Extract action text and assignee from line
         # Format: "- [ ] [Assignee]: [Action] (Due: ...) - Confidence: ..."
-        match = re.search(r'- \[ \] (?:([^:]+): )?(.+?)(?:\s*\(Due:|$)', action_line)
+        match = _ACTION_LINE_RE.search(action_line)
         if not match:
             return ""
 
@@ -722,11 +1085,11 @@ Format professionally and clinically. Be specific. Use simple formatting."""
         action_text = match.group(2).strip()
 
         # Generate action item ID the same way as in meeting_manager
-        action_item_id = hashlib.md5(f"{action_text}_{assignee}".encode()).hexdigest()[:8]
+        item_id = action_item_id(action_text, assignee)
 
         # Look up snippet path
-        if action_item_id in snippet_paths:
-            snippet_path = snippet_paths[action_item_id]
+        if item_id in snippet_paths:
+            snippet_path = snippet_paths[item_id]
             # Convert to relative path from meetings directory
             # Snippet is in meetings/snippets/, summary is in meetings/
             return f"snippets/{snippet_path.name}"
@@ -735,7 +1098,8 @@ Format professionally and clinically. Be specific. Use simple formatting."""
 
     def reset(self):
         """Reset analyzer state for a new meeting."""
-        self.conversation_history.clear()
+        # Recreate rather than clear: MeetingManager swaps in a full list for the summary
+        self.conversation_history = deque(maxlen=CONTEXT_HISTORY_CHUNKS)
         self.meeting_context = {
             'action_items': [],
             'decisions': [],
@@ -743,14 +1107,86 @@ Format professionally and clinically. Be specific. Use simple formatting."""
             'participants': set()
         }
         self.last_full_transcript = ""
+        self._clean_cache.clear()
+        self._context_cache = ""
+        self._context_dirty = True
         logger.info("Analyzer state reset")
 
-    def generate_status_check(self, meeting_history: List[Dict]) -> Dict:
+    def _cached_completion(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Send a single-prompt request, reusing a recent identical response.
+
+        Status checks and questions asked again within COMPLETION_CACHE_TTL
+        seconds over unchanged meeting history return the earlier answer
+        instead of making another API call.
+
+        Args:
+            prompt: User message content
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+            on_text: Optional callback given the response text as it streams in
+                (called once with the whole text on a cache hit)
+
+        Returns:
+            Response text
+        """
+        cache_key = hashlib.blake2b(
+            f"{self.model}\0{max_tokens}\0{temperature}\0{Config.PILOT_SYSTEM_CONTEXT}\0{prompt}".encode(),
+            digest_size=16
+        ).digest()
+
+        now = time.monotonic()
+        with self._completion_lock:
+            cached = self._completion_cache.get(cache_key)
+            if cached is not None and now - cached[0] < COMPLETION_CACHE_TTL:
+                self._completion_cache.move_to_end(cache_key)
+            else:
+                cached = None
+        if cached is not None:
+            logger.info("Reusing cached response for identical prompt")
+            if on_text:
+                on_text(cached[1])
+            return cached[1]
+
+        text = self._stream_text(
+            on_text=on_text,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=_system_blocks(),
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        with self._completion_lock:
+            self._completion_cache[cache_key] = (now, text)
+            self._completion_cache.move_to_end(cache_key)
+            if len(self._completion_cache) > COMPLETION_CACHE_SIZE:
+                self._completion_cache.popitem(last=False)
+        return text
+
+    def bust_cache(self):
+        """Forget cached status check / query responses (e.g. after new meetings are saved)."""
+        with self._completion_lock:
+            self._completion_cache.clear()
+
+    def generate_status_check(
+        self,
+        meeting_history: List[Dict],
+        meetings_with_summaries: Optional[int] = None
+    ) -> Dict:
         """
         Generate a comprehensive project management status report.
 
         Args:
             meeting_history: List of meeting data dicts from persistent memory
+            meetings_with_summaries: Number of meetings in meeting_history with a
+                summary, if already known (counted from the history otherwise)
 
         Returns:
             Dict with:
@@ -764,81 +1200,60 @@ Format professionally and clinically. Be specific. Use simple formatting."""
             logger.info("Generating comprehensive status check from meeting history...")
 
             # Get CURRENT date/time for accurate relative time calculations
-            from datetime import datetime, timedelta
-            current_datetime = datetime.now()
-            # Format for display: "February 16, 2026 at 2:45 PM CT"
-            current_date_formatted = current_datetime.strftime("%B %d, %Y at %I:%M %p CT")
-            # Date only for calculations
-            current_date_simple = current_datetime.strftime("%Y-%m-%d")
-            yesterday_date = (current_datetime - timedelta(days=1)).strftime("%Y-%m-%d")
+            current_date_formatted, current_date_simple, yesterday_date = _format_now(int(time.time()))
 
             # Analyze data quality
             total_meetings = len(meeting_history)
-            meetings_with_summaries = sum(1 for m in meeting_history if m.get('summary'))
+            if meetings_with_summaries is None:
+                meetings_with_summaries = sum(1 for m in meeting_history if m.get('summary'))
 
             # Get last 3 meetings for recent activity
-            last_3_meetings = meeting_history[-3:] if len(meeting_history) >= 3 else meeting_history
+            last_3_meetings = meeting_history[-3:]
             # Get last 10 meetings for comprehensive analysis
-            recent_meetings = meeting_history[-10:] if len(meeting_history) >= 10 else meeting_history
+            recent_meetings = meeting_history[-10:]
 
             # Extract all action items and decisions from recent meetings
-            all_action_items = []
-            all_decisions = []
-            all_key_points = []
-
-            # Track action items with meeting context
-            action_items_with_context = []
-            decisions_with_context = []
-
-            for meeting in recent_meetings:
-                meeting_date = meeting.get('date', 'Unknown date')
-                meeting_id = meeting.get('meeting_id', 'Unknown')
-
-                # Add meeting context to action items
-                for item in meeting.get('action_items', []):
-                    item_with_context = item.copy() if isinstance(item, dict) else {'text': str(item)}
-                    item_with_context['meeting_date'] = meeting_date
-                    item_with_context['meeting_id'] = meeting_id
-                    action_items_with_context.append(item_with_context)
-                    all_action_items.append(item)
-
-                # Add meeting context to decisions
-                for decision in meeting.get('decisions', []):
-                    decision_with_context = decision.copy() if isinstance(decision, dict) else {'text': str(decision)}
-                    decision_with_context['meeting_date'] = meeting_date
-                    decision_with_context['meeting_id'] = meeting_id
-                    decisions_with_context.append(decision_with_context)
-                    all_decisions.append(decision)
-
-                all_key_points.extend(meeting.get('key_topics', []))
+            all_action_items = list(chain.from_iterable(m.get('action_items', ()) for m in recent_meetings))
+            all_decisions = list(chain.from_iterable(m.get('decisions', ()) for m in recent_meetings))
+            all_key_points = list(chain.from_iterable(m.get('key_topics', ()) for m in recent_meetings))
+
+            # Track action items and decisions with meeting context
+            # (date/ID looked up once per meeting, not once per item)
+            meeting_refs = [
+                (m, m.get('date', 'Unknown date'), m.get('meeting_id', 'Unknown'))
+                for m in recent_meetings
+            ]
+            action_items_with_context = [
+                {
+                    **(item if isinstance(item, dict) else {'text': str(item)}),
+                    'meeting_date': meeting_date,
+                    'meeting_id': meeting_id
+                }
+                for m, meeting_date, meeting_id in meeting_refs
+                for item in m.get('action_items', ())
+            ]
+            decisions_with_context = [
+                {
+                    **(decision if isinstance(decision, dict) else {'text': str(decision)}),
+                    'meeting_date': meeting_date,
+                    'meeting_id': meeting_id
+                }
+                for m, meeting_date, meeting_id in meeting_refs
+                for decision in m.get('decisions', ())
+            ]
 
             # Calculate confidence based on data quality
-            confidence_score = 0
-            if total_meetings >= 5:
-                confidence_score += 30
-            elif total_meetings >= 2:
-                confidence_score += 15
-
-            if meetings_with_summaries >= 3:
-                confidence_score += 30
-            elif meetings_with_summaries >= 1:
-                confidence_score += 15
-
-            if len(all_action_items) >= 5:
-                confidence_score += 40
-            elif len(all_action_items) >= 2:
-                confidence_score += 20
+            confidence_score = (
+                _MEETING_SCORES[bisect_right(_MEETING_THRESHOLDS, total_meetings)]
+                + _SUMMARY_SCORES[bisect_right(_SUMMARY_THRESHOLDS, meetings_with_summaries)]
+                + _ACTION_SCORES[bisect_right(_ACTION_THRESHOLDS, len(all_action_items))]
+            )
 
             # Determine confidence level
-            if confidence_score >= 70:
-                confidence = "HIGH"
-                conf_explanation = f"Based on {total_meetings} meetings with {len(all_action_items)} action items."
-            elif confidence_score >= 40:
-                confidence = "MEDIUM"
-                conf_explanation = f"Limited data: {total_meetings} meetings, {len(all_action_items)} action items. May miss some context."
-            else:
-                confidence = "LOW"
-                conf_explanation = f"Insufficient data: Only {total_meetings} meetings recorded. Status check may be incomplete."
+            confidence, explanation = _CONFIDENCE_LEVELS[bisect_right(_CONFIDENCE_THRESHOLDS, confidence_score)]
+            conf_explanation = explanation.format(
+                meetings=total_meetings, action_items=len(all_action_items)
+            )
 
             # Prepare comprehensive meeting summaries for last 3 meetings
             last_3_summaries = []
@@ -849,12 +1264,15 @@ Format professionally and clinically. Be specific. Use simple formatting."""
                     'number': i,
                     'date': meeting_date,
                     'summary': meeting_summary,
-                    'action_count': len(meeting.get('action_items', [])),
-                    'decision_count': len(meeting.get('decisions', []))
+                    'action_count': len(meeting.get('action_items', ())),
+                    'decision_count': len(meeting.get('decisions', ()))
                 })
 
             # Generate comprehensive status report using AI
-            prompt = f"""You are a PROJECT MANAGER analyzing meeting history.
+            # Only the header carries per-call data; the instructions tail is
+            # built once per timezone
+            user_tz = Config.USER_TIMEZONE
+            header = f"""You are a PROJECT MANAGER analyzing meeting history.
 
 🚨 CRITICAL: CURRENT DATE & TIME 🚨
 CURRENT DATE/TIME: {current_date_formatted}
@@ -867,14 +1285,14 @@ USE THIS DATE FOR ALL CALCULATIONS:
 - When showing "days until deadline", calculate from TODAY
 
 TIMEZONE REQUIREMENT (CRITICAL):
-- User timezone: {Config.USER_TIMEZONE}
+- User timezone: {user_tz}
 - ALL times MUST include the timezone abbreviation
-- Use 12-hour format: "2:30 PM {Config.USER_TIMEZONE}" NOT "14:30" or "2:30 PM"
-- Format: "Meeting at 1:23 PM {Config.USER_TIMEZONE}" or "Deadline 5:00 PM {Config.USER_TIMEZONE}"
+- Use 12-hour format: "2:30 PM {user_tz}" NOT "14:30" or "2:30 PM"
+- Format: "Meeting at 1:23 PM {user_tz}" or "Deadline 5:00 PM {user_tz}"
 
 RELATIVE TIME CONTEXT (REQUIRED):
-- Include relative time for all dates: "Meeting 2/15 (yesterday) at 1:23 PM {Config.USER_TIMEZONE}"
-- For deadlines: "Feb 18 (in 2 days) at 5:00 PM {Config.USER_TIMEZONE}"
+- Include relative time for all dates: "Meeting 2/15 (yesterday) at 1:23 PM {user_tz}"
+- For deadlines: "Feb 18 (in 2 days) at 5:00 PM {user_tz}"
 - For past items: "Last discussed 2/13 (3 days ago)"
 - Calculate relative days from TODAY ({current_date_simple})
 
@@ -901,157 +1319,26 @@ DATA AVAILABLE:
 - Key topics: {len(all_key_points)}
 
 LAST 3 MEETINGS SUMMARY:
-{json.dumps(last_3_summaries, indent=2)}
+{_dumps_indented(last_3_summaries)}
 
 ALL ACTION ITEMS WITH MEETING DATES:
-{json.dumps(action_items_with_context, indent=2)}
+{_dumps_indented(action_items_with_context)}
 
 ALL DECISIONS WITH MEETING DATES:
-{json.dumps(decisions_with_context, indent=2)}
+{_dumps_indented(decisions_with_context)}
 
 KEY DISCUSSION TOPICS:
-{json.dumps(all_key_points, indent=2)}
+{_dumps_indented(all_key_points)}
+"""
 
-Generate a PROJECT MANAGEMENT STATUS REPORT with these EXACT sections:
+            prompt = "".join((header, _status_prompt_tail(user_tz)))
 
-═══════════════════════════════════════════════════════════
-EXECUTIVE SUMMARY:
-═══════════════════════════════════════════════════════════
-(2-3 sentences: Current project state based ONLY on what was STATED in meetings)
-CRITICAL: Include confidence level for project phase:
-- If phase explicitly stated: "[HIGH] Project phase: Testing (stated in 2/15 meeting)"
-- If phase unclear: "[UNCLEAR] Project phase not explicitly discussed in recent meetings"
-- If inferring: "[LOW - INFERRED] Project appears to be in X phase based on Y discussion"
-
-DO NOT STATE: "System is live" unless explicitly confirmed in a meeting
-DO NOT ASSUME: Go-live status, launch dates, or phases without clear evidence
-
-
-═══════════════════════════════════════════════════════════
-MY ACTION ITEMS:
-═══════════════════════════════════════════════════════════
-ONLY list items EXPLICITLY mentioned in action items data.
-Group by urgency:
-[URGENT] items - flag ONLY if explicitly marked urgent, blocking, or time-sensitive in data
-[NORMAL] items - all other action items
-
-Format: "- [URGENT/NORMAL] Task description (Meeting 2/15 3:30pm)"
-MUST include specific meeting date/time for each item
-If no clear owner in data, flag as "[NO OWNER]"
-DO NOT create action items not in the data
-
-
-═══════════════════════════════════════════════════════════
-WAITING ON OTHERS:
-═══════════════════════════════════════════════════════════
-List items assigned to other people/teams with:
-- Who: Task description (requested MM/DD)
-
-
-═══════════════════════════════════════════════════════════
-UPCOMING DEADLINES & DATES:
-═══════════════════════════════════════════════════════════
-ONLY list dates EXPLICITLY mentioned in meeting data:
-- MM/DD: What's due/happening [HIGH - stated in Meeting 2/XX]
-If date was implied but not stated: "[MEDIUM - implied from discussion in Meeting 2/XX]"
-Flag if overdue or coming up in next 2 weeks (based on report generation date)
-If NO dates mentioned, write: "No specific dates or deadlines mentioned in recent meetings"
-DO NOT infer dates not explicitly stated
-
-
-═══════════════════════════════════════════════════════════
-RECENT DECISIONS (Last 3 Meetings):
-═══════════════════════════════════════════════════════════
-Key decisions made:
-- Decision description (MM/DD meeting)
-
-
-═══════════════════════════════════════════════════════════
-BLOCKERS & RISKS:
-═══════════════════════════════════════════════════════════
-ONLY list blockers/risks EXPLICITLY mentioned or clearly implied:
-- Blocker/risk description [confidence level] (Meeting reference)
-
-Examples:
-"- Waiting on McKesson training dates [HIGH - explicitly stated as blocking in 2/13 meeting]"
-"- Budget approval pending [MEDIUM - mentioned in 2/10, 2/12 meetings, blocking inference]"
-
-If NO blockers mentioned: "No explicit blockers identified in recent meetings"
-DO NOT assume blockers from absence of updates
-
-
-═══════════════════════════════════════════════════════════
-WHAT'S NEXT - SPECIFIC ACTIONS:
-═══════════════════════════════════════════════════════════
-Based ONLY on action items and discussions in meeting data:
-- [ ] Action derived from open action items (Meeting reference)
-- [ ] Follow-up based on "waiting on" items (Meeting reference)
-
-Mark as [SUGGESTED] if inferring next step not explicitly stated
-Examples:
-"- [ ] Follow up with McKesson on dates [HIGH - action item from 2/13]"
-"- [ ] [SUGGESTED] Schedule check-in meeting [LOW - inferred from lack of updates]"
-
-If no clear next steps in data: "Next steps not explicitly defined in recent meetings"
-
-
-═══════════════════════════════════════════════════════════
-KEY METRICS:
-═══════════════════════════════════════════════════════════
-- Open action items: X (from action items data)
-- Meetings analyzed: X (from meeting count)
-- Decisions made (last 3 meetings): X
-- Trend assessment:
-  * Use [HIGH] for clearly evident trends from data
-  * Use [MEDIUM] for inferred trends with some evidence
-  * Use [LOW] for weak inferences
-  * Examples:
-    - "Making progress [MEDIUM - 5 of 8 items completed based on discussion]"
-    - "Status unclear [LOW - insufficient updates in recent meetings]"
-    - "Blocked [HIGH - McKesson dependency explicitly stated as blocker]"
-
-
-CRITICAL INSTRUCTIONS - ACCURACY REQUIREMENTS:
-- Use EXACT section headers with separators (═══)
-- ONLY state facts explicitly mentioned in meeting data
-- Include meeting reference for EVERY fact: "(Meeting 2/15 12:30pm)" or "(from 2/15 meeting)"
-- Use confidence tags: [HIGH], [MEDIUM], [LOW], [UNCLEAR]
-- Mark inferences: "[INFERRED from discussion about X]"
-- If project status/phase unclear, say so explicitly
-- Be SPECIFIC with meeting dates, names, deadlines
-- Flag URGENT items with [URGENT]
-- If section has no data, write "None identified" or "Not discussed in meetings"
-- DO NOT hallucinate facts - better to say "Unknown" or "Unclear"
-- DO NOT assume current status unless explicitly stated
-- Prioritize ACCURACY over completeness
-- Format for easy scanning (bullet points, clear structure)
-
-EXAMPLES OF PROPER DATE/TIME FORMATTING:
-✓ GOOD: "Meeting 2/15 (yesterday) at 1:23 PM {Config.USER_TIMEZONE}"
-✓ GOOD: "Deadline Feb 18 (in 2 days) at 5:00 PM {Config.USER_TIMEZONE}"
-✓ GOOD: "Last discussed 2/13 (3 days ago)"
-✗ BAD: "Meeting at 13:23" (no timezone, 24-hour format)
-✗ BAD: "Meeting at 1:23 PM" (no timezone)
-✗ BAD: "Follow-up by 2/18" (no relative time, no timezone)
-
-EXAMPLES OF PROPER GROUNDING:
-✓ GOOD: "Launch: Week of Feb 24 [HIGH - stated by [MANAGER] in 2/15 meeting at 2:30 PM {Config.USER_TIMEZONE}]"
-✓ GOOD: "[UNCLEAR] Current go-live status - not discussed in recent meetings"
-✓ GOOD: "Training mentioned [MEDIUM - implied from action item in 2/13 meeting]"
-✗ BAD: "System is currently live" (not stated anywhere)
-✗ BAD: "Project in operational phase" (assumption)
-✗ BAD: "Launch successful" (not confirmed)"""
-
-            response = self.client.messages.create(
-                model=self.model,
+            status_report = self._cached_completion(
+                prompt,
                 max_tokens=3000,  # Increased for comprehensive report
-                temperature=0.3,  # Lower for more consistent formatting
-                system=Config.PILOT_SYSTEM_CONTEXT,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=0.3  # Lower for more consistent formatting
             )
 
-            status_report = response.content[0].text
-
             logger.info("Comprehensive status check generated successfully")
 
             return {
@@ -1073,7 +1360,6 @@ EXAMPLES OF PROPER GROUNDING:
 
         except Exception as e:
             logger.error(f"Error generating status check: {e}")
-            import traceback
             traceback.print_exc()
             return {
                 'status_report': f"Error generating status check: {str(e)}",
@@ -1082,13 +1368,20 @@ EXAMPLES OF PROPER GROUNDING:
                 'data_quality': {}
             }
 
-    def query_meetings(self, question: str, meeting_history: List[Dict]) -> Dict:
+    def query_meetings(
+        self,
+        question: str,
+        meeting_history: List[Dict],
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> Dict:
         """
         Answer a specific question by searching meeting history.
 
         Args:
             question: User's question about meetings
             meeting_history: List of meeting data from persistent memory
+            on_text: Optional callback given each piece of the answer as it
+                streams in, so the UI can show it before the call finishes
 
         Returns:
             Dict with:
@@ -1100,20 +1393,17 @@ EXAMPLES OF PROPER GROUNDING:
             logger.info(f"Querying meetings: {question}")
 
             # Get recent meetings (last 15 for broader context)
-            recent_meetings = meeting_history[-15:] if len(meeting_history) > 15 else meeting_history
+            recent_meetings = meeting_history[-15:]
 
             # Build context from meeting summaries
-            context_parts = []
-            meeting_sources = []
-
-            for meeting in recent_meetings:
-                meeting_id = meeting.get('meeting_id', 'Unknown')
-                date = meeting.get('date', 'Unknown date')
-                summary = meeting.get('summary', '')
-
-                if summary:
-                    context_parts.append(f"\n--- MEETING {meeting_id} ({date}) ---\n{summary}\n")
-                    meeting_sources.append((meeting_id, date))
+            summarized = [
+                (m.get('meeting_id', 'Unknown'), m.get('date', 'Unknown date'), summary)
+                for m in recent_meetings if (summary := m.get('summary', ''))
+            ]
+            context_parts = [
+                f"\n--- MEETING {meeting_id} ({date}) ---\n{summary}\n"
+                for meeting_id, date, summary in summarized
+            ]
 
             full_context = "\n".join(context_parts)
 
@@ -1148,22 +1438,14 @@ Answer format:
 
 Source: Meeting [ID] on [date]"""
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=800,
-                temperature=0.3,
-                system=Config.PILOT_SYSTEM_CONTEXT,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            answer = response.content[0].text
+            answer = self._cached_completion(prompt, max_tokens=800, temperature=0.3, on_text=on_text)
 
             logger.info("Query answered successfully")
 
             return {
                 'answer': answer,
                 'confidence': confidence,
-                'sources': [f"{mid} ({date})" for mid, date in meeting_sources]
+                'sources': [f"{mid} ({date})" for mid, date, _ in summarized]
             }
 
         except Exception as e:
@@ -1,11 +1,13 @@
 """Audio capture module using Windows WASAPI loopback."""
 
 import pyaudiowpatch as pyaudio
-import wave
+import struct
 import threading
 import queue
 import time
 import logging
+import re
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Callable
@@ -14,6 +16,62 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Input devices that are not real microphones (mappers, loopback, mixes)
+MIC_SKIP_KEYWORDS = (
+    'stereo mix',
+    'loopback',
+    'mapper',  # Windows Sound Mapper
+    'wave',    # Microsoft Sound Mapper
+    'what u hear',
+    'wasapi',
+    'primary sound capture'
+)
+_MIC_SKIP_RE = re.compile('|'.join(map(re.escape, MIC_SKIP_KEYWORDS)), re.IGNORECASE)
+
+# Device name hints for auto-detection: real mics first, then generic inputs
+_MIC_NAME_RE = re.compile(r'mic', re.IGNORECASE)
+_GENERIC_INPUT_RE = re.compile(r'audio|input', re.IGNORECASE)
+
+# Frames PortAudio delivers per stream callback (~85 ms at 48 kHz); larger
+# buffers mean fewer Python wakeups on the audio path
+CAPTURE_FRAMES_PER_BUFFER = 4096
+
+# Cap on silence inserted for audio lost to one input overflow, so a bogus
+# stream timestamp cannot blow up a chunk
+MAX_OVERRUN_PAD_SECONDS = 2.0
+
+# Audio handed to audio_frame_callback is coalesced into batches of at least
+# this many seconds (streaming transcription APIs want 50-200 ms frames)
+FRAME_CALLBACK_BATCH_SECONDS = 0.1
+
+# Canonical 44-byte PCM WAV header: RIFF chunk, 'fmt ' subchunk, 'data' subchunk
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def wav_header(data_size: int, channels: int, sample_rate: int, sample_width: int = 2) -> bytes:
+    """
+    Build the WAV header for a PCM payload of known size.
+
+    Chunks are written in one go, so the sizes are final up front and the
+    header never has to be patched after the audio is written.
+
+    Args:
+        data_size: Number of bytes of PCM audio that follow the header
+        channels: Number of audio channels
+        sample_rate: Sample rate in Hz
+        sample_width: Bytes per sample (2 for 16-bit)
+
+    Returns:
+        44-byte header
+    """
+    block_align = channels * sample_width
+    return WAV_HEADER.pack(
+        b'RIFF', WAV_HEADER.size - 8 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size
+    )
+
 
 class AudioCapture:
     """Captures system audio using Windows WASAPI loopback."""
@@ -31,21 +89,73 @@ class AudioCapture:
         self.stream: Optional[pyaudio.Stream] = None
         self.recording = False
         self.capture_thread: Optional[threading.Thread] = None
-
-        # Queue for audio chunks (each chunk is ~30 seconds)
-        self.chunk_queue = queue.Queue()
-
-        # Buffer for current chunk
-        self.current_chunk = []
+        # Set by stop_recording() to wake the capture thread straight away
+        self._stop_event = threading.Event()
+
+        # Saved audio chunks (each chunk is ~30 seconds). One producer (the
+        # writer thread) and one consumer, so a deque plus a "not empty" event
+        # is enough; append/popleft are atomic
+        self._chunks: deque = deque()
+        self._chunk_event = threading.Event()
+
+        # Buffer for current chunk: preallocated once the stream format is known,
+        # filled up to _chunk_offset bytes and reused for every chunk
+        self._chunk_buf = bytearray()
+        self._chunk_offset = 0
+        self._chunk_bytes = 0
+        self._chunk_callback: Optional[Callable] = None
         self.chunk_start_time = None
 
+        # Input overflows (PortAudio dropped audio before we got it): counted
+        # per chunk and per recording. Lost audio is replaced with silence when
+        # the stream's ADC timestamps show how much went missing, which keeps
+        # chunk timing in step with the wall clock
+        self.overruns = 0
+        self._chunk_overruns = 0
+        self._bytes_per_frame = 0
+        self._next_adc_time = 0.0
+
+        # Full chunk buffers are handed to a writer thread so WAV file I/O never
+        # stalls stream.read(); written buffers come back via _free_buffers
+        self._write_queue: queue.Queue = queue.Queue()
+        self._free_buffers: queue.SimpleQueue = queue.SimpleQueue()
+        self.writer_thread: Optional[threading.Thread] = None
+        self._recordings_dir: Path = Config.RECORDINGS_DIR
+
         # Stream parameters (set during recording based on device capabilities)
         # These will be auto-detected from the microphone (typically 48000 Hz, mono)
         self.stream_channels = None  # Will be set from device
         self.stream_sample_rate = None  # Will be set from device (e.g., 48000 Hz)
 
-        # Optional callback for raw audio frames (for streaming transcription)
+        # Optional callback for raw audio frames (for streaming transcription),
+        # fed from a batch buffer once it holds _frame_batch_bytes of audio
         self.audio_frame_callback: Optional[Callable] = None
+        self._frame_batch = bytearray()
+        self._frame_batch_bytes = 0
+
+        # Device info list, filled on first use by _enumerate_devices()
+        self._device_cache: Optional[list] = None
+
+    def _enumerate_devices(self) -> list:
+        """
+        Get info for every audio device, querying PortAudio only once.
+
+        PortAudio snapshots the device list when PyAudio is initialized, so the
+        result cannot change until cleanup() terminates it.
+
+        Returns:
+            Device info dicts by device index (None where the query failed)
+        """
+        if self._device_cache is None:
+            devices = []
+            for i in range(self.audio.get_device_count()):
+                try:
+                    devices.append(self.audio.get_device_info_by_index(i))
+                except Exception as e:
+                    logger.warning(f"Could not query audio device {i}: {e}")
+                    devices.append(None)
+            self._device_cache = devices
+        return self._device_cache
 
     def get_default_microphone(self, device_index: Optional[int] = None) -> Optional[dict]:
         """
@@ -68,41 +178,33 @@ class AudioCapture:
             logger.info("Auto-detecting microphone...")
             candidates = []
 
-            for i in range(self.audio.get_device_count()):
-                info = self.audio.get_device_info_by_index(i)
+            for info in self._enumerate_devices():
+                if info is None:
+                    continue
+                i = info['index']
 
                 if info['maxInputChannels'] > 0:
-                    name_lower = info['name'].lower()
+                    name = info['name']
 
                     # Skip these device types
-                    skip_keywords = [
-                        'stereo mix',
-                        'loopback',
-                        'mapper',  # Windows Sound Mapper
-                        'wave',    # Microsoft Sound Mapper
-                        'what u hear',
-                        'wasapi',
-                        'primary sound capture'
-                    ]
-
-                    if any(keyword in name_lower for keyword in skip_keywords):
-                        logger.debug(f"Skipping {info['name']} (mapper/loopback device)")
+                    if _MIC_SKIP_RE.search(name):
+                        logger.debug(f"Skipping {name} (mapper/loopback device)")
                         continue
 
                     # Prioritize devices with "microphone" or "mic" in name
-                    priority = 0
-                    if 'microphone' in name_lower or 'mic' in name_lower:
+                    if _MIC_NAME_RE.search(name):
                         priority = 2
-                    elif 'audio' in name_lower or 'input' in name_lower:
+                    elif _GENERIC_INPUT_RE.search(name):
                         priority = 1
+                    else:
+                        priority = 0
 
                     candidates.append((priority, i, info))
                     logger.debug(f"Found input device: {info['name']} (priority: {priority})")
 
             if candidates:
-                # Sort by priority (highest first) and pick best
-                candidates.sort(reverse=True, key=lambda x: x[0])
-                priority, idx, best_device = candidates[0]
+                # Pick the highest priority (first found wins a tie)
+                priority, idx, best_device = max(candidates, key=lambda x: x[0])
                 logger.info(f"Auto-detected microphone: {best_device['name']}")
                 return best_device
 
@@ -122,9 +224,12 @@ class AudioCapture:
         print("AVAILABLE AUDIO DEVICES")
         print("="*60)
 
-        for i in range(self.audio.get_device_count()):
+        for i, info in enumerate(self._enumerate_devices()):
+            if info is None:
+                print(f"\nDevice {i}: Error - device info unavailable")
+                continue
+
             try:
-                info = self.audio.get_device_info_by_index(i)
                 device_type = []
                 if info['maxInputChannels'] > 0:
                     device_type.append("INPUT")
@@ -185,7 +290,8 @@ class AudioCapture:
             callback: Optional callback function called when a chunk is ready
             use_microphone: If True, use microphone instead of loopback
             microphone_device_index: Optional specific microphone device index
-            audio_frame_callback: Optional callback(audio_data: bytes) for raw audio frames
+            audio_frame_callback: Optional callback(audio_data: bytes) for raw audio
+                frames, delivered in batches of ~FRAME_CALLBACK_BATCH_SECONDS
         """
         if self.recording:
             logger.warning("Recording already in progress")
@@ -204,10 +310,27 @@ class AudioCapture:
                 raise RuntimeError("Could not find loopback audio device")
             logger.info("Using system audio loopback")
 
+        # Ensure the chunk directory exists once, not on every chunk save
+        self._recordings_dir = Config.RECORDINGS_DIR
+        self._recordings_dir.mkdir(parents=True, exist_ok=True)
+
         self.recording = True
+        self._stop_event.clear()
         self.chunk_start_time = time.time()
+        self.overruns = 0
+        self._chunk_overruns = 0
+        self._next_adc_time = 0.0
         self.audio_frame_callback = audio_frame_callback
 
+        # Start chunk writer thread (fresh queue per recording)
+        self._write_queue = queue.Queue()
+        self.writer_thread = threading.Thread(
+            target=self._writer_loop,
+            args=(self._write_queue,),
+            daemon=True
+        )
+        self.writer_thread.start()
+
         # Start capture thread
         self.capture_thread = threading.Thread(
             target=self._capture_loop,
@@ -223,25 +346,20 @@ class AudioCapture:
             return
 
         self.recording = False
+        self._stop_event.set()
 
-        # Stop the stream BEFORE joining the capture thread.
-        # stream.read() is a blocking call — if the microphone buffer is slow
-        # to fill (quiet room, device stall), it blocks until chunk_size frames
-        # arrive. Calling join() first means we wait up to 5 seconds for
-        # stream.read() to unblock naturally. If it doesn't, join() times out
-        # and _save_chunk() runs while the thread is still appending data,
-        # saving only the frames captured AFTER join() returned (~16 frames =
-        # 32KB) instead of the full partial chunk (~27 seconds = ~2.5MB).
-        # Stopping the stream first causes stream.read() to raise an exception
-        # immediately, so the thread exits within ~100ms and join() returns
-        # with all buffered data intact.
+        # Stop the stream BEFORE saving the final chunk.
+        # Audio arrives through _on_audio() on PortAudio's thread; stop_stream()
+        # returns only after the last pending callback has finished, so once it
+        # returns the chunk buffer is no longer being written and the partial
+        # chunk can be handed to the writer intact.
         if self.stream:
             try:
                 self.stream.stop_stream()
             except Exception as e:
                 logger.warning(f"Error stopping stream: {e}")
 
-        # Wait for capture thread to exit (fast now that stream is stopped)
+        # Wait for capture thread to exit (woken by _stop_event)
         if self.capture_thread:
             self.capture_thread.join(timeout=5)
             if self.capture_thread.is_alive():
@@ -255,9 +373,18 @@ class AudioCapture:
                 logger.warning(f"Error closing stream: {e}")
             self.stream = None
 
-        # Save any remaining audio in buffer
-        if self.current_chunk:
-            self._save_chunk()
+        # Deliver the last partial batch of frames
+        self._flush_frame_batch()
+
+        # Hand over any remaining audio in buffer, then wait for the writer
+        # so the final chunk is queued before we return
+        self._rotate_chunk()
+        if self.writer_thread:
+            self._write_queue.put(None)
+            self.writer_thread.join(timeout=10)
+            if self.writer_thread.is_alive():
+                logger.warning("Chunk writer still busy after 10s — final chunk may be late")
+            self.writer_thread = None
 
         logger.info("Audio recording stopped")
 
@@ -265,15 +392,16 @@ class AudioCapture:
         """
         Main capture loop running in separate thread.
 
+        Opens the stream in callback mode: PortAudio fills buffers on its own
+        thread and hands each one to _on_audio(), so this thread only waits
+        for the stop event.
+
         Args:
             device: Audio device info
             callback: Optional callback for chunk completion
             use_microphone: Whether using microphone input
         """
         try:
-            # Calculate chunk size in frames
-            chunk_size = 1024
-
             # Use optimal settings for microphone
             if use_microphone:
                 # Use mono, but keep device's native sample rate
@@ -291,61 +419,199 @@ class AudioCapture:
             logger.info(f"Detected microphone sample rate: {sample_rate} Hz (native)")
             logger.info(f"Using {channels} channel(s) for recording")
 
+            # Chunks are cut once chunk_duration of audio has been captured,
+            # counted in bytes rather than by wall clock. The buffer holds a full
+            # chunk plus one buffer of overshoot, so audio is copied straight into place
+            bytes_per_frame = channels * self.audio.get_sample_size(pyaudio.paInt16)
+            self._bytes_per_frame = bytes_per_frame
+            self._chunk_bytes = int(sample_rate * self.chunk_duration) * bytes_per_frame
+            buffer_size = self._chunk_bytes + CAPTURE_FRAMES_PER_BUFFER * bytes_per_frame
+            self._chunk_buf = bytearray(buffer_size)
+            self._chunk_offset = 0
+            # Second buffer to fill while the writer thread saves the first
+            self._free_buffers = queue.SimpleQueue()
+            self._free_buffers.put(bytearray(buffer_size))
+            self._chunk_callback = callback
+            self._frame_batch_bytes = int(sample_rate * FRAME_CALLBACK_BATCH_SECONDS) * bytes_per_frame
+            self._frame_batch.clear()
+
             # Open audio stream with NATIVE sample rate (no resampling)
             self.stream = self.audio.open(
                 format=pyaudio.paInt16,
                 channels=channels,
                 rate=sample_rate,  # CRITICAL: Use native rate, not Config.AUDIO_SAMPLE_RATE
-                frames_per_buffer=chunk_size,
+                frames_per_buffer=CAPTURE_FRAMES_PER_BUFFER,
                 input=True,
                 input_device_index=device["index"],
+                stream_callback=self._on_audio,
             )
 
             logger.info(f"✓ Audio stream opened: {sample_rate}Hz, {channels}ch, 16-bit PCM")
 
-            while self.recording:
-                try:
-                    # Read audio data
-                    data = self.stream.read(chunk_size, exception_on_overflow=False)
-                    self.current_chunk.append(data)
-
-                    # Call audio frame callback if set (for streaming transcription)
-                    if self.audio_frame_callback:
-                        try:
-                            self.audio_frame_callback(data)
-                        except Exception as e:
-                            logger.error(f"Error in audio frame callback: {e}")
-
-                    # Check if chunk duration reached
-                    elapsed = time.time() - self.chunk_start_time
-                    if elapsed >= self.chunk_duration:
-                        self._save_chunk()
-                        if callback:
-                            callback()
-
-                except Exception as e:
-                    if not self.recording:
-                        # Stream was stopped intentionally — exit cleanly
-                        break
-                    logger.error(f"Error reading audio: {e}")
-                    time.sleep(0.1)
+            # Returns as soon as stop_recording() sets the event; in between,
+            # check every 100 ms that the stream has not died
+            while not self._stop_event.wait(0.1):
+                if not self.stream.is_active():
+                    logger.error("Audio stream stopped unexpectedly")
+                    break
 
         except Exception as e:
             logger.error(f"Error in capture loop: {e}")
             self.recording = False
 
-    def _save_chunk(self):
-        """Save current audio chunk to queue and file."""
-        if not self.current_chunk:
+    def _on_audio(self, in_data: bytes, frame_count: int, time_info: dict, status: int):
+        """
+        PortAudio stream callback: append one buffer of audio to the current chunk.
+
+        Runs on PortAudio's thread, so it only copies the data, forwards it to
+        the frame callback and hands full chunks to the writer thread.
+
+        Args:
+            in_data: Captured audio bytes
+            frame_count: Number of frames in in_data
+            time_info: PortAudio timing info (input ADC time of this buffer)
+            status: PortAudio status flags (checked for input overflow)
+
+        Returns:
+            (None, paContinue) to keep the stream running
+        """
+        try:
+            adc_time = time_info.get('input_buffer_adc_time', 0.0) if time_info else 0.0
+            if status & pyaudio.paInputOverflow:
+                self._handle_overrun(adc_time)
+            if adc_time:
+                self._next_adc_time = adc_time + frame_count / self.stream_sample_rate
+
+            end = self._chunk_offset + len(in_data)
+            self._chunk_buf[self._chunk_offset:end] = in_data
+            self._chunk_offset = end
+
+            # Batch audio for the frame callback if set (for streaming transcription)
+            if self.audio_frame_callback:
+                self._frame_batch += in_data
+                if len(self._frame_batch) >= self._frame_batch_bytes:
+                    self._flush_frame_batch()
+
+            # Check if chunk duration reached
+            if end >= self._chunk_bytes:
+                self._rotate_chunk(self._chunk_callback)
+
+        except Exception as e:
+            logger.error(f"Error handling audio buffer: {e}")
+
+        return (None, pyaudio.paContinue)
+
+    def _handle_overrun(self, adc_time: float):
+        """
+        Count an input overflow and pad the chunk with silence for the lost audio.
+
+        Args:
+            adc_time: ADC time of the buffer that follows the gap (0 if the
+                host API does not report it)
+        """
+        self.overruns += 1
+        self._chunk_overruns += 1
+
+        if not (adc_time and self._next_adc_time):
+            logger.warning(f"Audio input overflow #{self.overruns} (lost audio not measurable)")
+            return
+
+        gap = min(adc_time - self._next_adc_time, MAX_OVERRUN_PAD_SECONDS)
+        missing = int(round(gap * self.stream_sample_rate)) * self._bytes_per_frame
+        logger.warning(f"Audio input overflow #{self.overruns}: padding {max(gap, 0.0) * 1000:.0f}ms of silence")
+
+        # Fill up to each chunk boundary, rotating as chunks complete; the
+        # buffer's overshoot room is left free for the incoming audio
+        while missing > 0:
+            n = min(missing, self._chunk_bytes - self._chunk_offset)
+            end = self._chunk_offset + n
+            self._chunk_buf[self._chunk_offset:end] = bytes(n)
+            self._chunk_offset = end
+            missing -= n
+            if end >= self._chunk_bytes:
+                self._rotate_chunk(self._chunk_callback)
+
+    def _flush_frame_batch(self):
+        """Pass any batched audio to the frame callback and empty the batch."""
+        if not self._frame_batch or not self.audio_frame_callback:
+            return
+
+        data = bytes(self._frame_batch)
+        self._frame_batch.clear()
+        try:
+            self.audio_frame_callback(data)
+        except Exception as e:
+            logger.error(f"Error in audio frame callback: {e}")
+
+    def _rotate_chunk(self, callback: Optional[Callable] = None):
+        """
+        Hand the current chunk buffer to the writer thread and start a new chunk.
+
+        Capture continues straight into a spare buffer; if the writer has not
+        returned one yet, a new buffer is allocated rather than waiting on it.
+
+        Args:
+            callback: Optional callback to run once this chunk has been saved
+        """
+        if not self._chunk_offset:
             return
 
+        # Only a float clock read here; the writer thread builds the datetime
+        now = time.time()
+        self._write_queue.put((
+            self._chunk_buf,
+            self._chunk_offset,
+            now - self.chunk_start_time,
+            now,
+            self._chunk_overruns,
+            callback
+        ))
+
         try:
-            # Create filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = Config.RECORDINGS_DIR / f"chunk_{timestamp}.wav"
+            self._chunk_buf = self._free_buffers.get_nowait()
+        except queue.Empty:
+            self._chunk_buf = bytearray(len(self._chunk_buf))
+        self._chunk_offset = 0
+        self._chunk_overruns = 0
+        self.chunk_start_time = now
+
+    def _writer_loop(self, write_queue: queue.Queue):
+        """
+        Save chunks handed over by _rotate_chunk() until a None sentinel arrives.
 
-            # Ensure directory exists
-            Config.RECORDINGS_DIR.mkdir(exist_ok=True)
+        Args:
+            write_queue: This recording's queue of (buffer, size, duration,
+                end_time, overruns, callback) tuples
+        """
+        while True:
+            item = write_queue.get()
+            if item is None:
+                break
+
+            buf, size, duration, end_time, overruns, callback = item
+            self._save_chunk(buf, size, duration, datetime.fromtimestamp(end_time), overruns)
+            self._free_buffers.put(buf)
+
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Error in chunk callback: {e}")
+
+    def _save_chunk(self, buf: bytearray, size: int, duration: float, timestamp: datetime, overruns: int = 0):
+        """
+        Save one audio chunk to file and queue.
+
+        Args:
+            buf: Chunk buffer holding the audio
+            size: Number of bytes of audio in buf
+            duration: Chunk duration in seconds
+            timestamp: When the chunk ended
+            overruns: Input overflows that occurred during this chunk
+        """
+        try:
+            # Create filename with timestamp (directory made by start_recording)
+            filename = self._recordings_dir / f"chunk_{timestamp:%Y%m%d_%H%M%S}.wav"
 
             # Use stored stream parameters - CRITICAL: MUST match actual recording
             channels = self.stream_channels if self.stream_channels else 1
@@ -354,29 +620,28 @@ class AudioCapture:
             if not self.stream_sample_rate:
                 logger.warning(f"Using fallback sample rate: {sample_rate}Hz (stream rate not set)")
 
-            # Write WAV file with NATIVE sample rate (no resampling)
-            with wave.open(str(filename), 'wb') as wf:
-                wf.setnchannels(channels)
-                wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-                wf.setframerate(sample_rate)  # CRITICAL: Must match recording rate
-                wf.writeframes(b''.join(self.current_chunk))
+            # Write WAV file with NATIVE sample rate (no resampling): header
+            # and audio in one pass, no seek back to patch sizes
+            header = wav_header(size, channels, sample_rate,  # CRITICAL: Must match recording rate
+                                self.audio.get_sample_size(pyaudio.paInt16))
+            with open(filename, 'wb') as f, memoryview(buf) as view:
+                f.write(header)
+                f.write(view[:size])
 
             # Add to queue
             chunk_info = {
                 'filename': filename,
-                'duration': time.time() - self.chunk_start_time,
-                'timestamp': datetime.now(),
+                'duration': duration,
+                'timestamp': timestamp,
                 'sample_rate': sample_rate,  # Actual sample rate used
-                'channels': channels
+                'channels': channels,
+                'overruns': overruns
             }
-            self.chunk_queue.put(chunk_info)
+            self._chunks.append(chunk_info)
+            self._chunk_event.set()
 
             logger.info(f"✓ Saved chunk: {filename.name} | {chunk_info['duration']:.1f}s | {sample_rate}Hz | {channels}ch")
 
-            # Reset for next chunk
-            self.current_chunk = []
-            self.chunk_start_time = time.time()
-
         except Exception as e:
             logger.error(f"Error saving chunk: {e}")
 
@@ -391,14 +656,28 @@ class AudioCapture:
             Chunk info dict or None if timeout/empty
         """
         try:
-            return self.chunk_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self._chunks.popleft()
+        except IndexError:
+            pass
+
+        # Clear, then re-check, so a chunk added in between still wakes us
+        self._chunk_event.clear()
+        try:
+            return self._chunks.popleft()
+        except IndexError:
+            pass
+
+        self._chunk_event.wait(timeout)
+        try:
+            return self._chunks.popleft()
+        except IndexError:
             return None
 
     def cleanup(self):
         """Cleanup resources."""
         self.stop_recording()
         self.audio.terminate()
+        self._device_cache = None
         logger.info("Audio capture cleaned up")
 
 
@@ -1,5 +1,6 @@
 """Audio snippet extraction for action items."""
 
+import hashlib
 import wave
 import logging
 import re
@@ -11,6 +12,23 @@ from difflib import SequenceMatcher
 logger = logging.getLogger(__name__)
 
 
+def action_item_id(item_text: str, assignee: str = "") -> str:
+    """
+    Stable 8-hex-char ID linking an action item to its audio snippet.
+
+    Shared by MeetingManager (which records snippets), the summary snippet
+    links and the HTML generator, so all three must derive it the same way.
+
+    Args:
+        item_text: Action item description
+        assignee: Assignee name, or empty string
+
+    Returns:
+        8-character hex ID
+    """
+    return hashlib.blake2b(f"{item_text}_{assignee}".encode(), digest_size=4).hexdigest()
+
+
 class AudioSnippetExtractor:
     """Extract and save audio snippets for action items."""
 
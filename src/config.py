@@ -91,6 +91,9 @@ class Config:
     # Snippets with meetings data
     SNIPPETS_DIR = MEETINGS_DIR / 'snippets'
 
+    # Sidecar mapping meeting_id -> {action item hash: snippet filename}
+    SNIPPETS_INDEX_FILE = SNIPPETS_DIR / 'snippets_index.json'
+
     # Failed chunks persistence
     FAILED_CHUNKS_DIR = BASE_DIR / 'failed_chunks'
 
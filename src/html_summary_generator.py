@@ -6,6 +6,8 @@ from typing import Dict, Optional, List
 import re
 import difflib
 
+from .audio_snippet_extractor import action_item_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -495,8 +497,6 @@ class HTMLSummaryGenerator:
         if not action_items and not action_items_with_snippets:
             return ""
 
-        import hashlib
-
         html = '<h2>Action Items</h2><ul>'
 
         # Fallback: if markdown parsing yielded no action item lines, render from snippets data directly
@@ -562,12 +562,12 @@ class HTMLSummaryGenerator:
                 action_text = match.group(2).strip()
 
                 # Generate action item ID
-                action_item_id = hashlib.md5(f"{action_text}_{assignee}".encode()).hexdigest()[:8]
+                item_id = action_item_id(action_text, assignee)
 
                 # Check if snippet exists by hash
                 snippet_path = None
-                if action_item_id in snippet_paths:
-                    snippet_path = snippet_paths[action_item_id]
+                if item_id in snippet_paths:
+                    snippet_path = snippet_paths[item_id]
                 elif action_items_with_snippets:
                     # Try fuzzy matching against the stored action items
                     snippet_path = self._find_snippet_by_fuzzy_match(action_text, assignee, action_items_with_snippets)
@@ -268,7 +268,10 @@ class MeetingListenerApp:
                     return
 
                 # Generate status check using AI analyzer
-                result = self.manager.analyzer.generate_status_check(meeting_history)
+                result = self.manager.analyzer.generate_status_check(
+                    meeting_history,
+                    meetings_with_summaries=self.manager.memory.meetings_with_summaries
+                )
 
                 # Save status report to file for record-keeping
                 try:
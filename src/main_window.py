@@ -798,7 +798,17 @@ class MainWindow:
                     self.root.after(0, self._show_answer, "No meetings recorded yet.")
                     return
 
-                result = self.app.manager.analyzer.query_meetings(question, meetings)
+                # Show the answer as it streams in; replaced by the full
+                # answer with confidence below once the call completes
+                streamed = []
+
+                def _on_text(delta):
+                    streamed.append(delta)
+                    self.root.after(0, self._show_answer, "".join(streamed))
+
+                result = self.app.manager.analyzer.query_meetings(
+                    question, meetings, on_text=_on_text
+                )
                 answer     = result.get("answer", "No answer returned.")
                 confidence = result.get("confidence", "")
                 sources    = result.get("sources", [])
@@ -15,7 +15,7 @@ from .ai_analyzer import MeetingAnalyzer
 from .notifier import MeetingNotifier
 from .config import Config
 from .persistent_memory import PersistentMemory
-from .audio_snippet_extractor import AudioSnippetExtractor
+from .audio_snippet_extractor import AudioSnippetExtractor, action_item_id
 from .html_summary_generator import HTMLSummaryGenerator
 from .live_action_notifier import LiveActionNotifier
 
@@ -605,11 +605,8 @@ class MeetingManager:
 
                     if snippet_path:
                         # Store snippet reference (both hash-based and direct)
-                        import hashlib
-                        action_item_id = hashlib.md5(
-                            f"{item['item']}_{item.get('assignee', '')}".encode()
-                        ).hexdigest()[:8]
-                        self.action_item_snippets[action_item_id] = snippet_path
+                        item_id = action_item_id(item['item'], item.get('assignee', ''))
+                        self.action_item_snippets[item_id] = snippet_path
 
                         # Also store with full action item info for easier matching
                         self.action_items_with_snippets.append({
@@ -1074,6 +1071,10 @@ Date: {self.meeting_start_time.strftime('%Y-%m-%d %H:%M')}
             # Pass the annotated+cleaned full transcript directly so the HTML always
             # contains the complete text — Claude's output is capped at max_tokens and
             # would truncate long meetings if we relied on it to reproduce the transcript.
+            # Record which snippet belongs to which action item so
+            # regenerate_html.py can reuse the mapping without rehashing
+            self._save_snippets_index()
+
             logger.info(f"DEBUG: Passing full_transcript to HTML generator, length={len(self.analyzer.last_full_transcript or '')} chars")
             html_path = self.html_generator.generate_html(
                 markdown_summary=metadata + summary,
@@ -1252,11 +1253,38 @@ Date: {self.meeting_start_time.strftime('%Y-%m-%d %H:%M')}
                         meeting_data['summary'] = f.read()
 
             self.memory.add_meeting(meeting_data)
+            self.analyzer.bust_cache()
             logger.info("Meeting saved to persistent memory")
 
         except Exception as e:
             logger.error(f"Error saving to memory: {e}")
 
+    def _save_snippets_index(self):
+        """Write this meeting's action item hash -> snippet filename map to the snippets index."""
+        if not self.meeting_id or not self.action_item_snippets:
+            return
+
+        try:
+            index_file = Config.SNIPPETS_INDEX_FILE
+            index = {}
+            if index_file.exists():
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+
+            index[self.meeting_id] = {
+                action_id: Path(snippet_path).name
+                for action_id, snippet_path in self.action_item_snippets.items()
+            }
+
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(index_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2)
+
+            logger.info(f"Saved {len(index[self.meeting_id])} snippets to {index_file.name}")
+
+        except Exception as e:
+            logger.error(f"Failed to save snippets index: {e}")
+
     def _get_meeting_duration(self) -> str:
         """Get formatted meeting duration."""
         if not self.meeting_start_time:
@@ -1583,6 +1611,20 @@ Date: {self.meeting_start_time.strftime('%Y-%m-%d %H:%M')}
         return success_count
 
 
+# Process-wide shared instance (see get_default_manager)
+_default_manager: Optional[MeetingManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_default_manager() -> MeetingManager:
+    """Get the shared MeetingManager for this process, creating it on first use."""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = MeetingManager()
+        return _default_manager
+
+
 def test_meeting_manager():
     """Test meeting manager functionality."""
     logging.basicConfig(
@@ -32,6 +32,11 @@ class PersistentMemory:
         }
         self.load()
 
+        # Kept up to date by add_meeting() so status checks need not rescan history
+        self.meetings_with_summaries = sum(
+            1 for m in self.memory_data['meetings'] if m.get('summary')
+        )
+
     def load(self):
         """
         Load memory from disk with corruption recovery.
@@ -193,6 +198,8 @@ class PersistentMemory:
                 self.memory_data['participants'].add(participant)
 
         self.memory_data['meetings'].append(meeting_record)
+        if meeting_record['summary']:
+            self.meetings_with_summaries += 1
         self.save()
         logger.info(f"Added meeting {meeting_data.get('meeting_id')} to persistent memory")
 
@@ -256,42 +263,52 @@ class PersistentMemory:
         Returns:
             Status: 'added', 'duplicate', or 'updated'
         """
-        # Check for duplicates by filename
-        existing_doc = None
-        for idx, doc in enumerate(self.memory_data['documents']):
-            if doc['filename'] == doc_path.name:
-                existing_doc = (idx, doc)
-                break
-
-        if existing_doc:
-            idx, doc = existing_doc
-            # Check if path is the same
-            if doc['path'] == str(doc_path):
-                logger.info(f"Duplicate skipped: {doc_path.name}")
-                return 'duplicate'
-            else:
-                # Same filename, different path - update it
-                self.memory_data['documents'][idx] = {
-                    'path': str(doc_path),
-                    'filename': doc_path.name,
-                    'type': doc_type,
-                    'added': datetime.now().isoformat()
-                }
-                self.save()
-                logger.info(f"Updated document: {doc_path.name}")
-                return 'updated'
-        else:
-            # New document
+        return self.add_documents([doc_path], doc_type)[0]
+
+    def add_documents(self, doc_paths: List[Path], doc_type: str = "REMS") -> List[str]:
+        """
+        Add several reference documents to memory with a single save.
+
+        Args:
+            doc_paths: Paths to documents
+            doc_type: Type of document (REMS, training, etc.)
+
+        Returns:
+            Status per path: 'added', 'duplicate', or 'updated'
+        """
+        documents = self.memory_data['documents']
+        index_by_name = {doc['filename']: idx for idx, doc in enumerate(documents)}
+        statuses = []
+
+        for doc_path in doc_paths:
             doc_record = {
                 'path': str(doc_path),
                 'filename': doc_path.name,
                 'type': doc_type,
                 'added': datetime.now().isoformat()
             }
-            self.memory_data['documents'].append(doc_record)
+
+            # Check for duplicates by filename
+            idx = index_by_name.get(doc_path.name)
+            if idx is None:
+                # New document
+                index_by_name[doc_path.name] = len(documents)
+                documents.append(doc_record)
+                logger.info(f"Added document: {doc_path.name}")
+                statuses.append('added')
+            elif documents[idx]['path'] == str(doc_path):
+                logger.info(f"Duplicate skipped: {doc_path.name}")
+                statuses.append('duplicate')
+            else:
+                # Same filename, different path - update it
+                documents[idx] = doc_record
+                logger.info(f"Updated document: {doc_path.name}")
+                statuses.append('updated')
+
+        if any(status != 'duplicate' for status in statuses):
             self.save()
-            logger.info(f"Added document: {doc_path.name}")
-            return 'added'
+
+        return statuses
 
     def get_documents(self) -> List[Dict]:
         """Get list of all uploaded documents."""
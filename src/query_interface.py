@@ -1,16 +1,22 @@
 """Live query interface to ask questions about documents and meeting history."""
 
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from anthropic import Anthropic
 
+from .ai_analyzer import SHARED_HTTP_CLIENT
 from .config import Config
 from .persistent_memory import PersistentMemory
 from .web_learner import WebLearner
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of answers kept in the in-process query cache
+QUERY_CACHE_SIZE = 512
+
 
 class QueryInterface:
     """Interface to query meeting history and uploaded documents."""
@@ -24,9 +30,12 @@ class QueryInterface:
         """
         self.memory = memory or PersistentMemory()
         self.web_learner = WebLearner()
-        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY, http_client=SHARED_HTTP_CLIENT)
         self.model = "claude-sonnet-4-5-20250929"
 
+        # LRU cache of answers, keyed by normalized question + knowledge snapshot
+        self._answer_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+
     def query(self, question: str, include_documents: bool = True) -> str:
         """
         Ask a question about REMS or meeting history.
@@ -41,6 +50,13 @@ class QueryInterface:
         try:
             logger.info(f"Processing query: {question}")
 
+            cache_key = self._cache_key(question, include_documents)
+            cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                self._answer_cache.move_to_end(cache_key)
+                logger.info("Query answered from cache")
+                return cached
+
             # Build context from meeting history
             context_parts = []
 
@@ -111,12 +127,35 @@ Answer:"""
 
             answer = response.content[0].text
             logger.info("Query answered successfully")
+
+            self._answer_cache[cache_key] = answer
+            if len(self._answer_cache) > QUERY_CACHE_SIZE:
+                self._answer_cache.popitem(last=False)
             return answer
 
         except Exception as e:
             logger.error(f"Error processing query: {e}")
             return f"Error processing query: {str(e)}"
 
+    def _cache_key(self, question: str, include_documents: bool) -> Tuple:
+        """
+        Build the answer cache key for a question.
+
+        The key includes a snapshot of the knowledge the answer was built from,
+        so new meetings, documents or web knowledge invalidate older answers.
+        """
+        normalized = " ".join(question.lower().split())
+        memory_data = self.memory.memory_data
+        documents = memory_data['documents']
+        return (
+            normalized,
+            include_documents,
+            len(memory_data['meetings']),
+            len(documents),
+            max((doc.get('added', '') for doc in documents), default=None),
+            self.web_learner.knowledge.get('last_updated'),
+        )
+
     def add_rems_document(self, doc_path: Path) -> str:
         """
         Add a supporting document to the knowledge base.
@@ -140,6 +179,36 @@ Answer:"""
             logger.error(f"Error adding document: {e}")
             return 'error'
 
+    def add_rems_documents(self, doc_paths: List[Path]) -> List[str]:
+        """
+        Add several supporting documents to the knowledge base at once.
+
+        Memory is saved to disk once for the whole batch rather than per file.
+
+        Args:
+            doc_paths: Paths to document files
+
+        Returns:
+            Status per path: 'added', 'duplicate', 'updated', or 'error'
+        """
+        statuses = ['error'] * len(doc_paths)
+        existing = []
+        for i, doc_path in enumerate(doc_paths):
+            if doc_path.exists():
+                existing.append(i)
+            else:
+                logger.error(f"Document not found: {doc_path}")
+
+        try:
+            added = self.memory.add_documents([doc_paths[i] for i in existing], doc_type="document")
+            for i, status in zip(existing, added):
+                statuses[i] = status
+                logger.info(f"Document {status}: {doc_paths[i].name}")
+        except Exception as e:
+            logger.error(f"Error adding documents: {e}")
+
+        return statuses
+
     def list_documents(self) -> List[str]:
         """Get list of all uploaded document names."""
         docs = self.memory.get_documents()
@@ -215,6 +284,25 @@ Answer:"""
         return "\n".join(lines)
 
 
+# Process-wide shared instance (see get_default_query_interface)
+_default_query_interface: Optional[QueryInterface] = None
+_default_query_interface_lock = threading.Lock()
+
+
+def get_default_query_interface(memory: Optional[PersistentMemory] = None) -> QueryInterface:
+    """
+    Get the shared QueryInterface for this process, creating it on first use.
+
+    Args:
+        memory: PersistentMemory to use if the instance has not been created yet
+    """
+    global _default_query_interface
+    with _default_query_interface_lock:
+        if _default_query_interface is None:
+            _default_query_interface = QueryInterface(memory=memory)
+        return _default_query_interface
+
+
 def test_query_interface():
     """Test query interface."""
     logging.basicConfig(
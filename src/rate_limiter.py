@@ -1,7 +1,8 @@
 """API rate limiter to prevent IP bans and runaway costs."""
 
 import logging
-from collections import deque
+import threading
+import time
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -12,7 +13,7 @@ class APIRateLimiter:
     Rate limiter for API calls to prevent IP bans and runaway costs.
 
     Features:
-    - Max calls per minute limit
+    - Max calls per minute limit (token bucket, bursts up to the per-minute cap)
     - Circuit breaker pattern (stops after consecutive failures)
     - Request queuing with backoff
     """
@@ -28,8 +29,14 @@ class APIRateLimiter:
         self.max_calls_per_minute = max_calls_per_minute
         self.circuit_breaker_threshold = circuit_breaker_threshold
 
-        # Track API call timestamps (sliding window)
-        self.call_timestamps = deque(maxlen=max_calls_per_minute)
+        # Token bucket: refills continuously at max_calls_per_minute / 60 per second
+        self.capacity = float(max_calls_per_minute)
+        self.refill_rate = max_calls_per_minute / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+        # Calls may come from several worker threads
+        self._lock = threading.Lock()
 
         # Circuit breaker state
         self.consecutive_failures = 0
@@ -43,11 +50,16 @@ class APIRateLimiter:
 
     def can_make_call(self) -> tuple[bool, float]:
         """
-        Check if we can make an API call now.
+        Check if we can make an API call now, reserving it if so.
 
         Returns:
             (can_call, wait_seconds) tuple
         """
+        with self._lock:
+            return self._check_capacity()
+
+    def _check_capacity(self) -> tuple[bool, float]:
+        """Check circuit breaker and token bucket (caller holds the lock)."""
         # Check circuit breaker
         if self.circuit_open:
             if datetime.now() < self.circuit_open_until:
@@ -57,42 +69,37 @@ class APIRateLimiter:
                 # Circuit breaker timeout expired, close circuit
                 self._close_circuit()
 
-        # Check rate limit (sliding window)
-        now = datetime.now()
+        # Check rate limit (token bucket)
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
 
-        # Remove calls older than 1 minute
-        cutoff_time = now - timedelta(minutes=1)
-        while self.call_timestamps and self.call_timestamps[0] < cutoff_time:
-            self.call_timestamps.popleft()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return (True, 0.0)
 
-        # Check if we have capacity
-        if len(self.call_timestamps) >= self.max_calls_per_minute:
-            # Calculate wait time until oldest call expires
-            oldest_call = self.call_timestamps[0]
-            wait_until = oldest_call + timedelta(minutes=1)
-            wait_seconds = (wait_until - now).total_seconds()
+        # Calculate wait time until the next token arrives
+        wait_seconds = (1 - self.tokens) / self.refill_rate
 
-            self.total_rate_limited += 1
-            logger.warning(f"Rate limit reached: {len(self.call_timestamps)}/{self.max_calls_per_minute} calls. "
-                          f"Wait {wait_seconds:.1f}s")
-            return (False, wait_seconds)
-
-        return (True, 0.0)
+        self.total_rate_limited += 1
+        logger.warning(f"Rate limit reached: {self.max_calls_per_minute} calls/minute. "
+                      f"Wait {wait_seconds:.1f}s")
+        return (False, wait_seconds)
 
     def record_call(self, success: bool):
         """Record an API call and update circuit breaker state."""
-        self.call_timestamps.append(datetime.now())
-        self.total_calls += 1
+        with self._lock:
+            self.total_calls += 1
 
-        if success:
-            self.consecutive_failures = 0
-        else:
-            self.consecutive_failures += 1
-            self.total_failures += 1
+            if success:
+                self.consecutive_failures = 0
+            else:
+                self.consecutive_failures += 1
+                self.total_failures += 1
 
-            # Open circuit breaker if threshold reached
-            if self.consecutive_failures >= self.circuit_breaker_threshold:
-                self._open_circuit()
+                # Open circuit breaker if threshold reached
+                if self.consecutive_failures >= self.circuit_breaker_threshold:
+                    self._open_circuit()
 
     def _open_circuit(self):
         """Open circuit breaker to prevent further calls."""
@@ -118,6 +125,6 @@ class APIRateLimiter:
             'total_rate_limited': self.total_rate_limited,
             'consecutive_failures': self.consecutive_failures,
             'circuit_open': self.circuit_open,
-            'current_calls_per_minute': len(self.call_timestamps),
+            'available_calls': int(self.tokens),
             'max_calls_per_minute': self.max_calls_per_minute
         }
@@ -1,9 +1,10 @@
 """Transcription module using OpenAI gpt-4o-transcribe API."""
 
+import io
 import logging
 import time
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import openai
 
 from .config import Config
@@ -39,7 +40,8 @@ class Transcriber:
     def transcribe_audio(
         self,
         audio_file: Path,
-        max_retries: int = 3
+        max_retries: int = 3,
+        upload_sample_rate: Optional[int] = None
     ) -> Optional[Dict]:
         """
         Transcribe audio file using OpenAI Whisper API.
@@ -47,6 +49,8 @@ class Transcriber:
         Args:
             audio_file: Path to audio file (WAV, MP3, M4A, etc. — max 25 MB)
             max_retries: Maximum number of retry attempts
+            upload_sample_rate: If set, WAV files recorded above this rate are
+                downsampled in memory before upload (e.g. 16000 for speech)
 
         Returns:
             Dict with transcription data or None if failed:
@@ -64,6 +68,9 @@ class Transcriber:
             logger.error(f"Audio file not found: {audio_file}")
             return None
 
+        # Downsample once up front so retries reuse the same payload
+        upload = self._downsample_wav(audio_file, upload_sample_rate) if upload_sample_rate else None
+
         for attempt in range(max_retries):
             try:
                 can_call, wait_seconds = self.rate_limiter.can_make_call()
@@ -85,14 +92,23 @@ class Transcriber:
                 logger.info(f"Transcribing {audio_file.name} via gpt-4o-transcribe (attempt {attempt + 1}/{max_retries})")
                 start_time = time.time()
 
-                with open(audio_file, 'rb') as f:
+                if upload:
                     response = self.client.audio.transcriptions.create(
                         model='gpt-4o-transcribe',
-                        file=f,
+                        file=upload,
                         response_format='json',
                         language='en',
                         temperature=Config.WHISPER_TEMPERATURE,
                     )
+                else:
+                    with open(audio_file, 'rb') as f:
+                        response = self.client.audio.transcriptions.create(
+                            model='gpt-4o-transcribe',
+                            file=f,
+                            response_format='json',
+                            language='en',
+                            temperature=Config.WHISPER_TEMPERATURE,
+                        )
 
                 self.rate_limiter.record_call(success=True)
                 elapsed = time.time() - start_time
@@ -143,12 +159,16 @@ class Transcriber:
         Transcribe an audio chunk from the capture module.
 
         Args:
-            chunk_info: Chunk info dict from AudioCapture
+            chunk_info: Chunk info dict from AudioCapture (may set
+                'upload_sample_rate' to downsample before upload)
 
         Returns:
             Dict with transcription and chunk metadata
         """
-        result = self.transcribe_audio(chunk_info['filename'])
+        result = self.transcribe_audio(
+            chunk_info['filename'],
+            upload_sample_rate=chunk_info.get('upload_sample_rate')
+        )
 
         if result:
             result.update({
@@ -159,6 +179,38 @@ class Transcriber:
 
         return result
 
+    def _downsample_wav(self, audio_file: Path, sample_rate: int) -> Optional[Tuple[str, bytes]]:
+        """
+        Resample a WAV file to a lower sample rate in memory.
+
+        Speech models resample to 16 kHz internally, so sending 44.1/48 kHz
+        chunks only makes the upload larger.
+
+        Args:
+            audio_file: Path to WAV file
+            sample_rate: Target sample rate
+
+        Returns:
+            (filename, wav_bytes) upload tuple, or None to send the file as-is
+        """
+        if audio_file.suffix.lower() != '.wav':
+            return None
+
+        try:
+            from pydub import AudioSegment
+
+            audio = AudioSegment.from_wav(str(audio_file))
+            if audio.frame_rate <= sample_rate:
+                return None
+
+            buffer = io.BytesIO()
+            audio.set_frame_rate(sample_rate).export(buffer, format='wav')
+            return (audio_file.name, buffer.getvalue())
+
+        except Exception as e:
+            logger.warning(f"Could not downsample {audio_file.name}, uploading original: {e}")
+            return None
+
     def batch_transcribe(
         self,
         audio_files: list,
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from anthropic import Anthropic
 
+from .ai_analyzer import SHARED_HTTP_CLIENT
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ class WebLearner:
         self.memory_dir = memory_dir or Config.MEETINGS_DIR
         _slug = Config.PRODUCT_NAME.lower().replace(' ', '_') if Config.PRODUCT_NAME else "product"
         self.knowledge_file = self.memory_dir / f"{_slug}_web_knowledge.json"
-        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY, http_client=SHARED_HTTP_CLIENT)
         self.model = "claude-sonnet-4-5-20250929"
 
         self.knowledge = {